@@ -3,6 +3,7 @@ from app.engine.ast_engine import run_ast_scan
 from app.engine.semgrep_engine import run_semgrep
 # Import the list of 8 rules from the folder
 from app.engine.rules.process import PROCESS_RULES 
+from app.api.v1.utils import decode_content
 
 router = APIRouter()
 
@@ -12,9 +13,7 @@ async def check_process(
     content: str = Body(...),
     is_base64: bool = Body(False)
 ):
-    import base64
-    if is_base64:
-        content = base64.b64decode(content).decode('utf-8')
+    content = decode_content(content, is_base64)
     findings = []
 
     # 1. Run the 8 Manual AST Files
@@ -22,7 +21,7 @@ async def check_process(
     findings.extend([f"[AST] {r['message']}" for r in ast_res])
 
     # 2. Run the Semgrep Rule
-    sem_res = run_semgrep(content, "app/engine/semgrep_rules/process.yaml")
+    sem_res = await run_semgrep(content, "app/engine/semgrep_rules/process.yaml")
     findings.extend([f"[SEMGREP] {m}" for m in sem_res])
 
     return {
@@ -2,7 +2,7 @@
 Classifier-Based Malicious Package Analysis (Stub - Not Yet Implemented).
 """
 from fastapi import APIRouter, Body
-from typing import List, Dict, Any
+from typing import List, Dict
 
 router = APIRouter()
 
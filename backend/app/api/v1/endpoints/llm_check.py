@@ -6,9 +6,15 @@ No code-level findings - only a high-level summary is returned.
 from fastapi import APIRouter, Body
 from typing import List, Dict, Any
 from google import genai
-from google.genai import types
+import asyncio
+import hashlib
+import io
 import os
+import random
+import string
+import tokenize
 from dotenv import load_dotenv
+from app.api.v1.utils import decode_content, json_loads
 
 load_dotenv()
 
@@ -23,6 +29,37 @@ else:
 
 router = APIRouter()
 
+# Max in-flight Gemini requests per batch; keeps us under the API QPS limit
+LLM_CONCURRENCY = 8
+
+# Retry policy for transient Gemini failures (rate limits, 5xx, network)
+LLM_RETRY_ATTEMPTS = 3
+# HTTP statuses worth retrying (google.genai errors.APIError.code)
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 503})
+
+def _is_retryable(e: Exception) -> bool:
+    """True for errors worth retrying: quota/rate limits, server overload, network issues."""
+    if isinstance(e, (ConnectionError, TimeoutError, asyncio.TimeoutError)):
+        return True
+    if getattr(e, 'code', None) in RETRYABLE_STATUS_CODES:
+        return True
+    # Status names only; bare digits would also match token counts, IDs, etc.
+    msg = str(e)
+    return 'RESOURCE_EXHAUSTED' in msg or 'UNAVAILABLE' in msg
+
+async def _with_retry(coro_factory, attempts: int = LLM_RETRY_ATTEMPTS):
+    """
+    Await `coro_factory()` with exponential backoff + jitter (1s, 2s, 4s ...).
+    Non-retryable errors and the final failed attempt are re-raised.
+    """
+    for attempt in range(attempts):
+        try:
+            return await coro_factory()
+        except Exception as e:
+            if attempt == attempts - 1 or not _is_retryable(e):
+                raise
+            await asyncio.sleep((2 ** attempt) + random.random())
+
 def _clean_error(e: Exception) -> str:
     """Extract a short, human-readable error message from Gemini API exceptions."""
     msg = str(e)
@@ -39,6 +76,40 @@ def _clean_error(e: Exception) -> str:
         return msg[:120] + '...'
     return msg
 
+# Token types that carry no code of their own on a line
+_LAYOUT_TOKENS = {tokenize.NL, tokenize.NEWLINE, tokenize.INDENT, tokenize.DEDENT, tokenize.ENDMARKER}
+
+def _compress_for_llm(src: str) -> str:
+    """
+    Strip comments and blank lines before sending source to Gemini; they add
+    input tokens but no malware signal. String literals are kept, even bare
+    ones, since a docstring can carry a payload the code later runs. Falls
+    back to the raw source if it can't be tokenized.
+    """
+    try:
+        tokens = list(tokenize.generate_tokens(io.StringIO(src).readline))
+    except (tokenize.TokenError, SyntaxError):
+        return src
+
+    # Split only on '\n' like the readline above, so rows line up with the
+    # token positions (str.splitlines also breaks on \x0c, \u2028, ...)
+    lines = src.split('\n')
+    comments = {}
+    keep_rows = set()
+    for tok in tokens:
+        if tok.type == tokenize.COMMENT:
+            comments[tok.start[0]] = tok.start[1]
+        elif tok.type not in _LAYOUT_TOKENS:
+            keep_rows.update(range(tok.start[0], tok.end[0] + 1))
+
+    out = []
+    for row in sorted(keep_rows):
+        line = lines[row - 1].rstrip('\r') if row <= len(lines) else ''
+        if row in comments:
+            line = line[:comments[row]].rstrip()
+        out.append(line)
+    return "\n".join(out)
+
 SECURITY_PROMPT_TEMPLATE = """You are a cybersecurity expert specialized in detecting malicious Python packages.
 Analyze the following Python source code for malicious behavior. 
 
@@ -68,7 +139,26 @@ Respond ONLY with a valid JSON object in this exact format (no markdown, no code
 }}
 """
 
-def analyze_file_with_gemini(file_path: str, content: str) -> Dict[str, Any]:
+def _split_template(template: str, *fields: str) -> List[str]:
+    """
+    Split a str.format template into its literal pieces (with {{ }} already
+    unescaped) around `fields`, so prompts can be built by concatenation
+    instead of re-parsing the template on every request.
+    """
+    pieces, seen = [''], []
+    for literal, field, _, _ in string.Formatter().parse(template):
+        pieces[-1] += literal
+        if field is not None:
+            seen.append(field)
+            pieces.append('')
+    assert tuple(seen) == fields, template
+    return pieces
+
+_SECURITY_HEAD, _SECURITY_MID, _SECURITY_TAIL = _split_template(
+    SECURITY_PROMPT_TEMPLATE, 'file_path', 'content'
+)
+
+async def analyze_file_with_gemini(file_path: str, content: str) -> Dict[str, Any]:
     """
     Send a single file to Gemini API for security analysis.
     Returns parsed JSON result.
@@ -83,14 +173,12 @@ def analyze_file_with_gemini(file_path: str, content: str) -> Dict[str, Any]:
             "error": True
         }
     try:
-        prompt = SECURITY_PROMPT_TEMPLATE.format(
-            file_path=file_path,
-            content=content[:8000]  # Limit to 8000 chars to stay within token limits
-        )
-        response = client.models.generate_content(
+        # Limit to 8000 chars to stay within token limits
+        prompt = f"{_SECURITY_HEAD}{file_path}{_SECURITY_MID}{_compress_for_llm(content)[:8000]}{_SECURITY_TAIL}"
+        response = await _with_retry(lambda: client.aio.models.generate_content(
             model='gemini-2.0-flash',
             contents=prompt,
-        )
+        ))
         text = response.text.strip()
 
         # Clean up possible markdown code fences
@@ -100,8 +188,7 @@ def analyze_file_with_gemini(file_path: str, content: str) -> Dict[str, Any]:
         elif text.startswith("json\n"):
             text = text[5:]
             
-        import json
-        result = json.loads(text)
+        result = json_loads(text)
         result["file"] = file_path
         return result
 
@@ -126,9 +213,7 @@ async def llm_file_check(
     Check a single file using the LLM for malicious intent.
     Used for one-by-one logging in the extension.
     """
-    if is_base64:
-        import base64
-        content = base64.b64decode(content).decode('utf-8', errors='ignore')
+    content = decode_content(content, is_base64, errors='ignore')
         
     if not file_path.endswith(".py") or len(content.strip()) < 10:
         return {
@@ -140,7 +225,7 @@ async def llm_file_check(
             "error": False
         }
         
-    return analyze_file_with_gemini(file_path, content)
+    return await analyze_file_with_gemini(file_path, content)
 
 
 @router.post("/llm_based_check")
@@ -151,60 +236,79 @@ async def llm_based_check(
     """
     Legacy endpoint for LLM-based analysis using Gemini API (batch).
     """
-    file_results = []
-    malicious_files = []
-    all_indicators = []
-    errors = []
-
+    # Decode, filter and key by content hash up front so we only spawn one
+    # task per unique file body (duplicate __init__.py shims, vendored copies)
+    ordered = []  # (file_path, content_key) in request order
+    unique_content: Dict[bytes, tuple] = {}  # content_key -> (first path, content)
     for file_info in files:
         file_path = file_info.get("file_path", "unknown.py")
-        content = file_info.get("content", "")
-        if file_info.get("is_base64"):
-            import base64
-            content = base64.b64decode(content).decode('utf-8', errors='ignore')
+        content = decode_content(file_info.get("content", ""), file_info.get("is_base64"), errors='ignore')
 
         # Only analyze Python files with actual content
         if not file_path.endswith(".py") or len(content.strip()) < 10:
             continue
 
-        result = analyze_file_with_gemini(file_path, content)
-        file_results.append(result)
+        key = hashlib.blake2b(content.encode('utf-8', 'ignore'), digest_size=16).digest()
+        if key not in unique_content:
+            unique_content[key] = (file_path, content)
+        ordered.append((file_path, key))
+
+    # Gemini calls are I/O bound; run them concurrently, capped by a semaphore
+    sem = asyncio.Semaphore(LLM_CONCURRENCY)
+
+    async def _analyze_one(file_path: str, content: str) -> Dict[str, Any]:
+        async with sem:
+            return await analyze_file_with_gemini(file_path, content)
+
+    keys = list(unique_content)
+    unique_results = await asyncio.gather(*[_analyze_one(*unique_content[k]) for k in keys])
+    results_by_key = dict(zip(keys, unique_results))
+
+    malicious_files = []
+    unique_indicators: Dict[str, None] = {}  # insertion-ordered set
+    errors = []
+
+    # Single pass: fan each unique result back out to every path sharing that
+    # content while accumulating errors, malicious files and indicators
+    for file_path, key in ordered:
+        result = results_by_key[key]
 
         if result.get("error"):
             errors.append(file_path)
 
         if result.get("is_malicious"):
+            indicators = result.get("indicators", [])
             malicious_files.append({
                 "file": file_path,
                 "confidence": result.get("confidence", "LOW"),
-                "indicators": result.get("indicators", []),
+                "indicators": indicators,
                 "summary": result.get("summary", "")
             })
-            all_indicators.extend(result.get("indicators", []))
+            unique_indicators.update(dict.fromkeys(indicators))
 
     is_malicious = len(malicious_files) > 0
     verdict = "MALICIOUS" if is_malicious else "BENIGN"
 
     # Build overall summary
     if is_malicious:
-        unique_indicators = list(set(all_indicators))
+        key_findings = list(unique_indicators)[:5]
         overall_summary = (
             f"Package '{package_name}' contains malicious indicators in "
-            f"{len(malicious_files)} out of {len(file_results)} analyzed file(s). "
-            f"Key findings: {'; '.join(unique_indicators[:5])}"
+            f"{len(malicious_files)} out of {len(ordered)} analyzed file(s). "
+            f"Key findings: {'; '.join(key_findings)}"
             if unique_indicators else
             f"Package '{package_name}' was flagged as potentially malicious by LLM analysis."
         )
     else:
         overall_summary = (
             f"Package '{package_name}' appears safe. "
-            f"Analyzed {len(file_results)} Python file(s) with no malicious indicators detected."
+            f"Analyzed {len(ordered)} Python file(s) with no malicious indicators detected."
         )
 
     return {
         "verdict": verdict,
         "package_name": package_name,
-        "files_analyzed": len(file_results),
+        "files_analyzed": len(ordered),
         "malicious_files_count": len(malicious_files),
         "summary": overall_summary,
         "malicious_files": malicious_files,
@@ -225,6 +329,10 @@ Respond ONLY with a valid JSON object in this exact format (no markdown, no bloc
 }}
 """
 
+_SUGGEST_HEAD, _SUGGEST_MID, _SUGGEST_TAIL = _split_template(
+    SUGGEST_PROMPT, 'package_name', 'package_name'
+)
+
 @router.post("/suggest_alternatives")
 async def suggest_alternatives(
     package_name: str = Body(..., embed=True),
@@ -239,11 +347,11 @@ async def suggest_alternatives(
             "alternatives": []
         }
     try:
-        prompt = SUGGEST_PROMPT.format(package_name=package_name)
-        response = client.models.generate_content(
+        prompt = f"{_SUGGEST_HEAD}{package_name}{_SUGGEST_MID}{package_name}{_SUGGEST_TAIL}"
+        response = await _with_retry(lambda: client.aio.models.generate_content(
             model='gemini-2.0-flash',
             contents=prompt,
-        )
+        ))
         text = response.text.strip()
         
         if text.startswith("```"):
@@ -252,8 +360,7 @@ async def suggest_alternatives(
         elif text.startswith("json\n"):
             text = text[5:]
             
-        import json
-        result = json.loads(text)
+        result = json_loads(text)
         return {
             "success": True,
             "alternatives": result.get("alternatives", [])
@@ -1,51 +1,25 @@
 from fastapi import APIRouter, Body
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
 from typing import List, Dict, Any
-import ast
+from collections import Counter, OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+import asyncio
+import hashlib
+import multiprocessing
 import os
-import glob
-import importlib
 
 # Engines
 from app.engine.ast_engine import run_ast_scan
-from app.engine.regex_engine import run_regex_scan
+from app.engine.regex_engine import run_regex_scan, compile_pattern, compile_prefilter
+from app.engine.rules import get_rules
+from app.api.v1.utils import decode_content, json_dumps
 
-# Dynamic Rule Loading
-def load_ast_rules(directory: str):
-    """
-    Dynamically loads all `check` functions from python files in the directory.
-    """
-    rules = []
-    base_path = "app/engine/rules/" + directory
-    
-    # Assuming standard structure relative to app root
-    # We need to list files in `backend/app/engine/rules/{directory}`
-    # but import them as `app.engine.rules.{directory}.{filename}`
-    
-    # Resolve absolute path for listing
-    abs_path = os.path.join(os.path.dirname(__file__), "../../../engine/rules", directory)
-    print(f"Loading rules from: {abs_path}")
-    
-    if not os.path.exists(abs_path):
-        return rules
-
-    for filename in os.listdir(abs_path):
-        if filename.endswith(".py") and not filename.startswith("__"):
-            module_name = filename[:-3]
-            full_module_path = f"app.engine.rules.{directory}.{module_name}"
-            try:
-                mod = importlib.import_module(full_module_path)
-                if hasattr(mod, 'check'):
-                    rules.append(mod.check)
-            except Exception as e:
-                print(f"Error loading rule {full_module_path}: {e}")
-    return rules
-
-# Load rules once on startup (or lazy load)
-# For simplicity, loading them globally here.
+# Rules are imported once per category from their package-level lists
 AST_RULES = []
 categories = ['execution', 'network', 'file_ops', 'evasion', 'exfiltration', 'metadata']
 for cat in categories:
-    AST_RULES.extend(load_ast_rules(cat))
+    AST_RULES.extend(get_rules(cat))
 
 # Regex Patterns (Move to a separate config file in production)
 REGEX_PATTERNS = [
@@ -64,41 +38,66 @@ REGEX_PATTERNS = [
     # Add more robust regexes later
 ]
 
+# Compile once at import; the patterns are static
+# (optional `unique` / `needs_snippet` flags are passed through as-is)
+COMPILED_PATTERNS = [
+    {**p, "pattern": compile_pattern(p['pattern'])}
+    for p in REGEX_PATTERNS
+]
+# All patterns in one regex; files matching none of them are skipped in one pass
+REGEX_PREFILTER = compile_prefilter([p['pattern'] for p in REGEX_PATTERNS])
+
 router = APIRouter()
 
-@router.post("/check")
-async def scan_package(
-    file_path: str = Body(..., embed=True),
-    content: str = Body(..., embed=True),
-    is_base64: bool = Body(False, embed=True)
-):
-    import base64
-    if is_base64:
-        content = base64.b64decode(content).decode('utf-8')
-    findings = []
-    
-    # 1. AST Scan (Python only)
-    if file_path.endswith('.py'):
-        ast_results = run_ast_scan(content, AST_RULES)
-        findings.extend(ast_results)
+# Worker processes for /batch_check; AST scanning is CPU-bound pure Python, so
+# threads would serialize on the GIL. Workers reach the rules and patterns as
+# module globals, so nothing but the file is pickled. The pool is created and
+# shut down by the app lifespan (see main.py).
+PROCESS_POOL = None
 
-    # 2. Regex Scan (All files)
-    # Compile regexes first
-    compiled_patterns = []
-    import re
-    for p in REGEX_PATTERNS:
-        compiled_patterns.append({
-            "id": p['id'],
-            "pattern": re.compile(p['pattern']),
-            "message": p['message'],
-            "severity": p['severity']
-        })
-        
-    regex_results = run_regex_scan(content, compiled_patterns)
-    findings.extend(regex_results)
+def start_process_pool():
+    global PROCESS_POOL
+    # Workers start lazily, by which time the server has its event loop and
+    # to_thread workers running; forking a threaded process can deadlock, so
+    # start them from a clean forkserver (spawn where that's unavailable)
+    method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+    PROCESS_POOL = ProcessPoolExecutor(
+        max_workers=min(8, os.cpu_count() or 1),
+        mp_context=multiprocessing.get_context(method)
+    )
 
-    # 3. Aggregation & Formatting
-    is_danger = any(f['severity'] in ['CRITICAL', 'HIGH'] for f in findings)
+def shutdown_process_pool():
+    global PROCESS_POOL
+    if PROCESS_POOL is not None:
+        PROCESS_POOL.shutdown(cancel_futures=True)
+        PROCESS_POOL = None
+
+# Findings of recently scanned files keyed by content hash, so re-submitted
+# packages (and files duplicated within one batch, e.g. vendored copies) are
+# only scanned once. Only touched from the event loop, so no lock is needed.
+_FINDINGS_CACHE_SIZE = 4096
+_FINDINGS_CACHE: "OrderedDict[bytes, List[Dict[str, Any]]]" = OrderedDict()
+
+def _findings_key(file_path: str, content: str, is_base64: bool) -> bytes:
+    # Only whether the file gets the AST pass depends on its path
+    h = hashlib.blake2b(content.encode('utf-8', 'surrogatepass'), digest_size=16)
+    h.update(b'\x01' if is_base64 else b'\x00')
+    h.update(b'\x01' if file_path.endswith('.py') else b'\x00')
+    return h.digest()
+
+def _stream_summary(header: Dict[str, Any], summary_list: List[Dict[str, Any]]):
+    """
+    Yields the summary response as a single JSON object, serializing the
+    `summary` entries one at a time instead of building the whole payload.
+    """
+    yield json_dumps(header)[:-1] + ', "summary": ['
+    for i, item in enumerate(summary_list):
+        yield (', ' if i else '') + json_dumps(item)
+    yield ']}'
+
+def _file_result(file_path: str, findings: List[Dict[str, Any]]) -> Dict[str, Any]:
+    sev_counts = Counter(f['severity'] for f in findings)
+    is_danger = sev_counts['CRITICAL'] + sev_counts['HIGH'] > 0
     
     # Enhanced response format
     return {
@@ -108,13 +107,107 @@ async def scan_package(
         "violations": [f"Line {f['line']}: {f['message']}" for f in findings],
         "stats": {
             "total": len(findings),
-            "critical": sum(1 for f in findings if f['severity'] == 'CRITICAL'),
-            "high": sum(1 for f in findings if f['severity'] == 'HIGH'),
-            "warning": sum(1 for f in findings if f['severity'] == 'WARNING'),
-            "info": sum(1 for f in findings if f['severity'] == 'INFO')
+            "critical": sev_counts['CRITICAL'],
+            "high": sev_counts['HIGH'],
+            "warning": sev_counts['WARNING'],
+            "info": sev_counts['INFO']
         }
     }
 
+def _error_result(file_path: str, error: BaseException) -> Dict[str, Any]:
+    """/batch_check result for a file that couldn't be scanned (e.g. bad base64)."""
+    return {**_file_result(file_path, []), "status": "ERROR", "error": f"Scan failed: {error}"}
+
+def _scan_findings(file_path: str, content: str, is_base64: bool = False) -> List[Dict[str, Any]]:
+    """/check findings for one file; runs inside a PROCESS_POOL worker."""
+    content = decode_content(content, is_base64)
+    findings = []
+    if file_path.endswith('.py'):
+        findings.extend(run_ast_scan(content, AST_RULES))
+    findings.extend(run_regex_scan(content, COMPILED_PATTERNS, REGEX_PREFILTER))
+    return findings
+
+@router.post("/check")
+async def scan_package(
+    file_path: str = Body(..., embed=True),
+    content: str = Body(..., embed=True),
+    is_base64: bool = Body(False, embed=True)
+):
+    content = decode_content(content, is_base64)
+    findings = []
+
+    # 1. AST Scan (Python only) and 2. Regex Scan (All files) are independent,
+    # so run them in worker threads and let the regex pass overlap the AST walk
+    regex_task = asyncio.to_thread(run_regex_scan, content, COMPILED_PATTERNS, REGEX_PREFILTER)
+    if file_path.endswith('.py'):
+        ast_results, regex_results = await asyncio.gather(
+            asyncio.to_thread(run_ast_scan, content, AST_RULES),
+            regex_task
+        )
+        findings.extend(ast_results)
+    else:
+        regex_results = await regex_task
+    findings.extend(regex_results)
+
+    # 3. Aggregation & Formatting
+    return _file_result(file_path, findings)
+
+class BatchFile(BaseModel):
+    """One /batch_check entry; same fields as the /check body."""
+    file_path: str
+    content: str
+    is_base64: bool = False
+
+@router.post("/batch_check")
+async def batch_check(
+    files: List[BatchFile] = Body(..., embed=True)
+):
+    """
+    Scan a whole package in one request. Each entry takes the same fields as
+    /check (file_path, content, is_base64) and gets the same result back, in
+    order; files are spread across worker processes, and files whose content
+    was scanned recently are answered from the findings cache. A file that
+    fails to scan gets an ERROR result without failing the rest of the batch.
+    """
+    loop = asyncio.get_running_loop()
+    keys = []
+    results = {}
+    pending = {}
+    for f in files:
+        key = _findings_key(f.file_path, f.content, f.is_base64)
+        keys.append(key)
+        if key in results or key in pending:
+            continue
+        cached = _FINDINGS_CACHE.get(key)
+        if cached is not None:
+            _FINDINGS_CACHE.move_to_end(key)
+            results[key] = cached
+        else:
+            pending[key] = loop.run_in_executor(
+                PROCESS_POOL, _scan_findings,
+                f.file_path, f.content, f.is_base64
+            )
+
+    if pending:
+        done = await asyncio.gather(*pending.values(), return_exceptions=True)
+        for key, findings in zip(pending, done):
+            results[key] = findings
+            # Failures are answered per file and never cached
+            if isinstance(findings, BaseException):
+                continue
+            _FINDINGS_CACHE[key] = findings
+            if len(_FINDINGS_CACHE) > _FINDINGS_CACHE_SIZE:
+                _FINDINGS_CACHE.popitem(last=False)
+
+    out = []
+    for f, key in zip(files, keys):
+        findings = results[key]
+        if isinstance(findings, BaseException):
+            out.append(_error_result(f.file_path, findings))
+        else:
+            out.append(_file_result(f.file_path, findings))
+    return out
+
 @router.post("/summary")
 async def scan_summary(
     findings_data: List[Dict[str, Any]] = Body(..., embed=True)
@@ -151,17 +244,19 @@ async def scan_summary(
         key=lambda x: (severity_order.get(x['severity'], 99), -x['count'])
     )
     
-    is_malicious = any(f['severity'] in ['CRITICAL', 'HIGH'] for f in all_findings)
+    sev_counts = Counter(f['severity'] for f in all_findings)
+    is_malicious = sev_counts['CRITICAL'] + sev_counts['HIGH'] > 0
     
-    return {
+    header = {
         "verdict": "MALICIOUS" if is_malicious else "BENIGN",
         "total_issues": len(all_findings),
         "files_scanned": file_count,
-        "summary": summary_list,
         "stats": {
-            "critical": sum(1 for f in all_findings if f['severity'] == 'CRITICAL'),
-            "high": sum(1 for f in all_findings if f['severity'] == 'HIGH'),
-            "warning": sum(1 for f in all_findings if f['severity'] == 'WARNING'),
-            "info": sum(1 for f in all_findings if f['severity'] == 'INFO')
+            "critical": sev_counts['CRITICAL'],
+            "high": sev_counts['HIGH'],
+            "warning": sev_counts['WARNING'],
+            "info": sev_counts['INFO']
         }
     }
+    # Same JSON shape as before, streamed so large summaries start arriving early
+    return StreamingResponse(_stream_summary(header, summary_list), media_type="application/json")
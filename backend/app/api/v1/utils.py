@@ -0,0 +1,39 @@
+"""
+Shared request helpers for the v1 endpoints.
+"""
+try:
+    # SIMD-accelerated decoder (AVX2/SSSE3 picked at runtime), same API as base64
+    import pybase64 as _b64
+except ImportError:
+    import base64 as _b64
+
+try:
+    # Faster JSON encode/decode; falls back to the stdlib with the same results
+    import orjson
+except ImportError:
+    orjson = None
+    import json
+
+
+def decode_content(content: str, is_base64: bool, errors: str = 'strict') -> str:
+    """
+    Returns the file content sent by the extension, decoding it when it was
+    base64-encoded. `errors` is passed through to the UTF-8 decode.
+    """
+    if not is_base64:
+        return content
+    return _b64.b64decode(content, validate=False).decode('utf-8', errors)
+
+
+def json_loads(text):
+    """Parses a JSON document (str or bytes), using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def json_dumps(obj) -> str:
+    """Serializes `obj` to a JSON string, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode('utf-8')
+    return json.dumps(obj)
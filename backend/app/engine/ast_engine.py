@@ -1,23 +1,149 @@
 import ast
+import hashlib
+import threading
+from collections import OrderedDict
+from functools import lru_cache
 
-class SecurityVisitor(ast.NodeVisitor):
+# Parsed-tree cache keyed by content hash. The same file is often rescanned
+# (extension re-uploads, retries, several rule sets), and SecurityVisitor only
+# reads the tree, so sharing parsed trees across requests is safe.
+_PARSE_CACHE_SIZE = 256
+_PARSE_CACHE: "OrderedDict[bytes, ast.AST]" = OrderedDict()
+_PARSE_CACHE_LOCK = threading.Lock()
+
+def _parse_cached(content: str) -> ast.AST:
+    key = hashlib.blake2b(content.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+    with _PARSE_CACHE_LOCK:
+        tree = _PARSE_CACHE.get(key)
+        if tree is not None:
+            _PARSE_CACHE.move_to_end(key)
+            return tree
+
+    # Parse outside the lock so concurrent misses don't serialize
+    tree = ast.parse(content)
+
+    with _PARSE_CACHE_LOCK:
+        _PARSE_CACHE[key] = tree
+        if len(_PARSE_CACHE) > _PARSE_CACHE_SIZE:
+            _PARSE_CACHE.popitem(last=False)
+    return tree
+
+def _is_wildcard(rule_func):
+    return getattr(rule_func, 'targets', None) is None and getattr(rule_func, 'methods', None) is None
+
+class _Dispatch:
+    """
+    Maps a Call's resolved name and method name (see rules.call_targets) to
+    the rules that can fire on it. Rules declaring neither run on every Call.
+    Lists keep the original rule_set order so findings come out unchanged.
+    """
     def __init__(self, rule_set):
         self.rule_set = rule_set
+        self.names = set()
+        self.methods = set()
+        for rule_func in rule_set:
+            self.names.update(getattr(rule_func, 'targets', None) or ())
+            self.methods.update(getattr(rule_func, 'methods', None) or ())
+        self.wildcard = [r for r in rule_set if _is_wildcard(r)]
+        # Keys are limited to declared names/methods, so this stays bounded
+        self._lists = {(None, None): self.wildcard}
+
+    def rules_for(self, name, method):
+        key = (name if name in self.names else None, method if method in self.methods else None)
+        rules = self._lists.get(key)
+        if rules is None:
+            rules = [
+                r for r in self.rule_set
+                if _is_wildcard(r)
+                or key[0] in (getattr(r, 'targets', None) or ())
+                or key[1] in (getattr(r, 'methods', None) or ())
+            ]
+            self._lists[key] = rules
+        return rules
+
+@lru_cache(maxsize=32)
+def _build_dispatch(rule_set: tuple) -> _Dispatch:
+    return _Dispatch(rule_set)
+
+def _iter_calls(tree):
+    """
+    Yields Call nodes in the same pre-order NodeVisitor would visit them,
+    using an explicit stack instead of recursive visit/generic_visit calls.
+    """
+    # Children are pushed in reverse field order (what ast.iter_child_nodes
+    # would yield, reversed) without building a generator per node
+    AST, Call = ast.AST, ast.Call
+    stack = [tree]
+    pop = stack.pop
+    push = stack.append
+    while stack:
+        node = pop()
+        if type(node) is Call:
+            yield node
+        for name in reversed(node._fields):
+            value = getattr(node, name, None)
+            if isinstance(value, list):
+                for item in reversed(value):
+                    if isinstance(item, AST):
+                        push(item)
+            elif isinstance(value, AST):
+                push(value)
+
+class SecurityVisitor:
+    """
+    Runs the rule set over a module in two flat passes: the first collects
+    imports and aliases, the second evaluates rules on every Call with the
+    complete alias table, so calls that appear before an import or alias
+    assignment are still resolved.
+    """
+    # Fixed attribute layout: one visitor per file, and rules read these on
+    # every Call they inspect
+    __slots__ = (
+        'rule_set', '_dispatch', 'findings', 'aliases', 'imports',
+        '_resolve_cache', '_dotted_cache', '_keyword_cache',
+        '_open_modes_cache', '_string_args_cache', '_rule_caches',
+    )
+
+    def __init__(self, rule_set):
+        self.rule_set = rule_set
+        self._dispatch = _build_dispatch(tuple(rule_set))
         self.findings = []
         # Track aliases: {'sp': 'subprocess', 'system': 'os.system', ...}
         self.aliases = {} 
         self.imports = set()
+        # id(Call node) -> qualified / dotted name; live only as long as this scan
+        self._resolve_cache = {}
+        self._dotted_cache = {}
+        self._keyword_cache = {}
+        self._open_modes_cache = {}
+        self._string_args_cache = {}
+        # Per-rule scratch dicts handed out by rule_cache()
+        self._rule_caches = {}
+
+    def scan(self, tree):
+        # Pass 1: imports and alias assignments
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                self._absorb_import(node)
+            elif isinstance(node, ast.ImportFrom):
+                self._absorb_import_from(node)
+            elif isinstance(node, ast.Assign):
+                self._absorb_assign(node)
 
-    def visit_Import(self, node):
+        # Pass 2: rules on calls
+        for node in _iter_calls(tree):
+            self._check_call(node)
+        return self.findings
+
+    def _absorb_import(self, node):
         for alias in node.names:
             self.imports.add(alias.name)
             if alias.asname:
                 self.aliases[alias.asname] = alias.name
             else:
                 self.aliases[alias.name] = alias.name
-        self.generic_visit(node)
 
-    def visit_ImportFrom(self, node):
+    def _absorb_import_from(self, node):
         module = node.module or ''
         for alias in node.names:
             full_name = f"{module}.{alias.name}" if module else alias.name
@@ -26,24 +152,8 @@ class SecurityVisitor(ast.NodeVisitor):
                 self.aliases[alias.asname] = full_name
             else:
                 self.aliases[alias.name] = full_name
-        self.generic_visit(node)
-
-    def visit_Call(self, node):
-        # Pass the visitor instance (self) to the rule function so it can access aliases
-        for rule_func in self.rule_set:
-            result = rule_func(node, self)
-            if result:
-                self.findings.append({
-                    "line": node.lineno,
-                    "col_offset": getattr(node, "col_offset", 0),
-                    "end_col_offset": getattr(node, "end_col_offset", 0),
-                    "message": result.get('message'),
-                    "severity": result.get('severity', 'WARNING'),
-                    "rule_id": result.get('id')
-                })
-        self.generic_visit(node)
 
-    def visit_Assign(self, node):
+    def _absorb_assign(self, node):
         # Basic tracking of local aliases like `s = subprocess`
         # This is complex in static analysis, but we can do simple cases
         if isinstance(node.value, ast.Name) and node.value.id in self.aliases:
@@ -52,13 +162,150 @@ class SecurityVisitor(ast.NodeVisitor):
             for target in node.targets:
                 if isinstance(target, ast.Name):
                     self.aliases[target.id] = unknown_source
-        self.generic_visit(node)
+
+    def qualified_name(self, node):
+        """
+        Resolved `mod.func` / `func` name of a Call through the alias table,
+        e.g. `sp.Popen` -> `subprocess.Popen`. Computed once per Call node and
+        shared by every rule that looks at it.
+        """
+        key = id(node)
+        try:
+            return self._resolve_cache[key]
+        except KeyError:
+            pass
+        name = None
+        func = node.func
+        # ast.parse never produces node subclasses, so exact type checks are safe
+        func_type = type(func)
+        if func_type is ast.Attribute:
+            value = func.value
+            if type(value) is ast.Name:
+                module = self.aliases.get(value.id, value.id)
+                name = f"{module}.{func.attr}"
+        elif func_type is ast.Name:
+            name = self.aliases.get(func.id, func.id)
+        self._resolve_cache[key] = name
+        return name
+
+    def dotted_name(self, node):
+        """
+        Full dotted name of a Call's attribute chain with the base name
+        resolved through aliases, e.g. `os.environ.get`. Cached per Call node
+        like qualified_name.
+        """
+        key = id(node)
+        try:
+            return self._dotted_cache[key]
+        except KeyError:
+            pass
+        parts = []
+        current = node.func
+        while type(current) is ast.Attribute:
+            parts.append(current.attr)
+            current = current.value
+        if type(current) is ast.Name:
+            parts.append(self.aliases.get(current.id, current.id))
+        name = ".".join(reversed(parts))
+        self._dotted_cache[key] = name
+        return name
+
+    def keyword_value(self, node, arg):
+        """
+        Value node passed as keyword `arg` to a Call (e.g. the `True` in
+        `shell=True`), or None. The keyword map is built once per Call node.
+        """
+        if not node.keywords:
+            return None
+        key = id(node)
+        keywords = self._keyword_cache.get(key)
+        if keywords is None:
+            keywords = self._keyword_cache[key] = {k.arg: k.value for k in node.keywords}
+        return keywords.get(arg)
+
+    def open_modes(self, node):
+        """
+        Constant string modes passed to an open()-style Call, positionally
+        (second argument) and/or as `mode=`. Computed once per Call node, as
+        several file rules inspect the mode of the same open().
+        """
+        key = id(node)
+        modes = self._open_modes_cache.get(key)
+        if modes is None:
+            modes = []
+            if len(node.args) >= 2:
+                mode = node.args[1]
+                if type(mode) is ast.Constant and type(mode.value) is str:
+                    modes.append(mode.value)
+            mode = self.keyword_value(node, 'mode')
+            if type(mode) is ast.Constant and type(mode.value) is str:
+                modes.append(mode.value)
+            modes = self._open_modes_cache[key] = tuple(modes)
+        return modes
+
+    def string_args(self, node):
+        """
+        Constant string values passed to a Call, positional arguments first,
+        then keyword values. Empty for most calls, which lets the URL and
+        webhook rules skip them without looping over the arguments.
+        """
+        key = id(node)
+        values = self._string_args_cache.get(key)
+        if values is None:
+            values = []
+            for arg in node.args:
+                if type(arg) is ast.Constant and type(arg.value) is str:
+                    values.append(arg.value)
+            for k in node.keywords:
+                value = k.value
+                if type(value) is ast.Constant and type(value.value) is str:
+                    values.append(value.value)
+            values = self._string_args_cache[key] = tuple(values)
+        return values
+
+    def rule_cache(self, key):
+        """
+        Dict a rule can use to memoize its own per-node work for this scan
+        (e.g. keyed by id(node)); `key` is usually the rule's module name.
+        Dropped with the visitor, so entries never outlive the file.
+        """
+        cache = self._rule_caches.get(key)
+        if cache is None:
+            cache = self._rule_caches[key] = {}
+        return cache
+
+    def _check_call(self, node):
+        # Only run rules that can fire on this call (plus untargeted ones)
+        name = self.qualified_name(node)
+        if type(node.func) is ast.Attribute:
+            method = node.func.attr
+        else:
+            method = name.rpartition('.')[2] if name else None
+        rules = self._dispatch.rules_for(name, method)
+        if not rules:
+            return
+        findings = self.findings
+        # Pass the visitor instance (self) to the rule function so it can access aliases
+        for rule_func in rules:
+            result = rule_func(node, self)
+            if result:
+                findings.append({
+                    "line": node.lineno,
+                    "col_offset": node.col_offset,
+                    "end_col_offset": node.end_col_offset or 0,
+                    "message": result.get('message'),
+                    "severity": result.get('severity', 'WARNING'),
+                    "rule_id": result.get('id')
+                })
 
 def run_ast_scan(content: str, rule_set: list):
+    # Rules only run on Calls and every call needs a '(' in the source, so
+    # data-only files (constants, __init__ re-exports) skip parsing entirely
+    if '(' not in content:
+        return []
     try:
-        tree = ast.parse(content)
+        tree = _parse_cached(content)
         visitor = SecurityVisitor(rule_set)
-        visitor.visit(tree)
-        return visitor.findings
+        return visitor.scan(tree)
     except SyntaxError:
         return []
\ No newline at end of file
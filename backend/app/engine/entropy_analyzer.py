@@ -9,10 +9,56 @@ Research basis:
 - Used by GuardDog, PyGuardEX, and other malware detection tools
 """
 
+import functools
 import math
 from typing import Tuple
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
+# Character classes for pattern checks, as both byte-deletion sets (ASCII fast
+# path) and str.translate tables, so counting happens in C instead of a
+# Python-level generator per class
+_BASE64_CHARS = 'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/='
+_HEX_CHARS = '0123456789abcdefABCDEF'
+_BASE64_BYTES = _BASE64_CHARS.encode('ascii')
+_HEX_BYTES = _HEX_CHARS.encode('ascii')
+_BASE64_DELETE = str.maketrans('', '', _BASE64_CHARS)
+_HEX_DELETE = str.maketrans('', '', _HEX_CHARS)
+
+
+# Result caches for the string checks. The same literals (common payloads,
+# package boilerplate) recur across scans; very long strings bypass the cache
+# so it can't pin large inputs in memory.
+_CACHE_SIZE = 4096
+_CACHE_MAX_LEN = 65536
+
+
+def _cached_for_short_strings(func):
+    """lru_cache `func`, calling it uncached for non-str or very long arguments."""
+    cached = functools.lru_cache(maxsize=_CACHE_SIZE)(func)
+
+    @functools.wraps(func)
+    def wrapper(string, *args, **kwargs):
+        if not isinstance(string, str) or len(string) > _CACHE_MAX_LEN:
+            return func(string, *args, **kwargs)
+        return cached(string, *args, **kwargs)
+
+    wrapper.cache_info = cached.cache_info
+    wrapper.cache_clear = cached.cache_clear
+    return wrapper
+
+
+def _count_chars_in(string: str, chars_bytes: bytes, delete_table: dict) -> int:
+    """Count characters of `string` that belong to a character class."""
+    if string.isascii():
+        return len(string) - len(string.encode('ascii').translate(None, chars_bytes))
+    return len(string) - len(string.translate(delete_table))
+
+
+@_cached_for_short_strings
 def calculate_entropy(data: str) -> float:
     """
     Calculate Shannon entropy of a string.
@@ -38,6 +84,14 @@ def calculate_entropy(data: str) -> float:
     if not data:
         return 0.0
     
+    # Fast path: ASCII strings map 1:1 to bytes, so a 256-bin histogram
+    # gives the same per-character frequencies without a Python loop
+    if np is not None and data.isascii():
+        counts = np.bincount(np.frombuffer(data.encode('ascii'), dtype=np.uint8), minlength=256)
+        counts = counts[counts > 0]
+        probabilities = counts / len(data)
+        return float((probabilities * np.log2(1 / probabilities)).sum())
+    
     # Count frequency of each character
     freq_map = {}
     for char in data:
@@ -55,6 +109,7 @@ def calculate_entropy(data: str) -> float:
     return entropy
 
 
+@_cached_for_short_strings
 def is_likely_encoded(string: str, threshold: float = 5.0, min_length: int = 40) -> Tuple[bool, float]:
     """
     Determine if a string is likely to be encoded/obfuscated based on entropy.
@@ -121,13 +176,11 @@ def analyze_string_patterns(string: str) -> dict:
     entropy = calculate_entropy(string)
     
     # Check for Base64 pattern (alphanumeric + +/= characters)
-    base64_chars = set('ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/=')
-    base64_ratio = sum(1 for c in string if c in base64_chars) / len(string)
+    base64_ratio = _count_chars_in(string, _BASE64_BYTES, _BASE64_DELETE) / len(string)
     likely_base64 = (base64_ratio > 0.95 and len(string) % 4 == 0)
     
     # Check for hex pattern (only 0-9, a-f, A-F)
-    hex_chars = set('0123456789abcdefABCDEF')
-    hex_ratio = sum(1 for c in string if c in hex_chars) / len(string)
+    hex_ratio = _count_chars_in(string, _HEX_BYTES, _HEX_DELETE) / len(string)
     likely_hex = (hex_ratio > 0.95 and len(string) % 2 == 0)
     
     # Character diversity (unique chars / total chars)
@@ -142,6 +195,7 @@ def analyze_string_patterns(string: str) -> dict:
     }
 
 
+@_cached_for_short_strings
 def is_suspicious_string(string: str) -> Tuple[bool, str]:
     """
     High-level check if a string is suspicious (likely malicious obfuscation).
@@ -11,7 +11,17 @@ Research basis:
 """
 
 import re
-from typing import List, Dict, Tuple, Optional
+import string
+from functools import lru_cache
+from typing import List, Dict, Optional
+
+try:
+    # Myers' bit-parallel edit distance in C; the pure-Python DP is the fallback
+    from rapidfuzz.distance import Levenshtein as _Lev
+    from rapidfuzz.process import cdist as _cdist
+except ImportError:
+    _Lev = None
+    _cdist = None
 
 
 def levenshtein_distance(s1: str, s2: str) -> int:
@@ -36,26 +46,91 @@ def levenshtein_distance(s1: str, s2: str) -> int:
         >>> levenshtein_distance("numpy", "nunpy")
         1
     """
+    if _Lev is not None:
+        return _Lev.distance(s1, s2)
+    # Distance is symmetric; order the pair so both orders share a cache entry
+    if s2 < s1:
+        s1, s2 = s2, s1
+    return _levenshtein_cached(s1, s2)
+
+
+# Fallback path only: repeated (name, popular) pairs across scans skip the DP
+_LEVENSHTEIN_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=_LEVENSHTEIN_CACHE_SIZE)
+def _levenshtein_cached(s1: str, s2: str) -> int:
     if len(s1) < len(s2):
-        return levenshtein_distance(s2, s1)
+        s1, s2 = s2, s1
     
     if len(s2) == 0:
         return len(s1)
     
-    # Initialize distance matrix
-    previous_row = range(len(s2) + 1)
+    # Single DP row updated in place; prev_diag holds the previous row's
+    # value at j - 1 before it is overwritten
+    row = list(range(len(s2) + 1))
     
     for i, c1 in enumerate(s1):
-        current_row = [i + 1]
-        for j, c2 in enumerate(s2):
+        prev_diag = row[0]
+        row[0] = i + 1
+        for j, c2 in enumerate(s2, 1):
+            above = row[j]
             # Cost of insertions, deletions, or substitutions
-            insertions = previous_row[j + 1] + 1
-            deletions = current_row[j] + 1
-            substitutions = previous_row[j] + (c1 != c2)
-            current_row.append(min(insertions, deletions, substitutions))
+            row[j] = min(above + 1, row[j - 1] + 1, prev_diag + (c1 != c2))
+            prev_diag = above
+    
+    return row[-1]
+
+
+def bounded_levenshtein(s1: str, s2: str, k: int) -> int:
+    """
+    Levenshtein distance capped at k: returns the exact distance when it is
+    <= k and k + 1 otherwise (same contract as rapidfuzz's score_cutoff).
+    
+    Strings whose lengths differ by more than k are rejected outright, and
+    only the diagonal band of width 2k+1 is filled in, so each comparison is
+    O(len * k) instead of O(len1 * len2).
+    """
+    if abs(len(s1) - len(s2)) > k:
+        return k + 1
+    if s2 < s1:
+        s1, s2 = s2, s1
+    return _bounded_levenshtein_cached(s1, s2, k)
+
+
+@lru_cache(maxsize=_LEVENSHTEIN_CACHE_SIZE)
+def _bounded_levenshtein_cached(s1: str, s2: str, k: int) -> int:
+    n, m = len(s1), len(s2)
+    over = k + 1  # every value above k is equivalent
+    previous_row = [j if j <= k else over for j in range(m + 1)]
+    
+    for i in range(1, n + 1):
+        current_row = [over] * (m + 1)
+        current_row[0] = i if i <= k else over
+        row_min = current_row[0]
+        c1 = s1[i - 1]
+        for j in range(max(1, i - k), min(m, i + k) + 1):
+            cost = min(
+                previous_row[j] + 1,                      # deletion
+                current_row[j - 1] + 1,                   # insertion
+                previous_row[j - 1] + (c1 != s2[j - 1])   # substitution
+            )
+            if cost < over:
+                current_row[j] = cost
+                if cost < row_min:
+                    row_min = cost
+        if row_min > k:
+            return over
         previous_row = current_row
     
-    return previous_row[-1]
+    return previous_row[m]
+
+
+def _lowered(popular_packages: List[str]) -> List[str]:
+    """Lowercased candidate names; the default TOP_PACKAGES list is lowered once at import."""
+    if popular_packages is TOP_PACKAGES:
+        return _TOP_PACKAGES_LOWER
+    return [p.lower() for p in popular_packages]
 
 
 def check_typosquatting(package_name: str, popular_packages: List[str], threshold: int = 2) -> Dict[str, any]:
@@ -84,21 +159,56 @@ def check_typosquatting(package_name: str, popular_packages: List[str], threshol
             'severity': 'CRITICAL' | 'WARNING' | 'INFO'
         }
     """
+    package_lower = package_name.lower()
+    
+    popular_lowers = _lowered(popular_packages)
+    
+    if _cdist is not None:
+        # One C++ sweep over every candidate; distances above the cutoff come
+        # back as threshold + 1
+        distances = _cdist(
+            [package_lower], popular_lowers,
+            scorer=_Lev.distance, score_cutoff=threshold
+        )[0].tolist()
+    else:
+        distances = [bounded_levenshtein(package_lower, p, threshold) for p in popular_lowers]
+    
+    return _typosquatting_result(package_name, popular_packages, distances, threshold)
+
+
+def check_typosquatting_batch(package_names: List[str], popular_packages: Optional[List[str]] = None,
+                              threshold: int = 2) -> List[Dict[str, any]]:
+    """
+    check_typosquatting for many names at once (e.g. a whole requirements
+    file). With rapidfuzz the full names x popular_packages distance matrix
+    is computed in one cdist call spread over all cores.
+    
+    Returns one result per name, in order, identical to check_typosquatting.
+    """
+    if popular_packages is None:
+        popular_packages = TOP_PACKAGES
+    if _cdist is None:
+        return [check_typosquatting(name, popular_packages, threshold) for name in package_names]
+    
+    matrix = _cdist(
+        [name.lower() for name in package_names], _lowered(popular_packages),
+        scorer=_Lev.distance, score_cutoff=threshold, workers=-1
+    ).tolist()
+    return [
+        _typosquatting_result(name, popular_packages, distances, threshold)
+        for name, distances in zip(package_names, matrix)
+    ]
+
+
+def _typosquatting_result(package_name: str, popular_packages: List[str],
+                          distances: List[int], threshold: int) -> Dict[str, any]:
+    """Builds the check_typosquatting result from the name's distance row."""
     similar_packages = []
     min_distance = float('inf')
     
-    package_lower = package_name.lower()
-    
-    for popular in popular_packages:
-        popular_lower = popular.lower()
-        
-        # Skip if exact match
-        if package_lower == popular_lower:
-            continue
-        
-        distance = levenshtein_distance(package_lower, popular_lower)
-        
-        if distance <= threshold:
+    for popular, distance in zip(popular_packages, distances):
+        # Skip if exact match (distance 0)
+        if 0 < distance <= threshold:
             similar_packages.append({
                 'name': popular,
                 'distance': distance
@@ -126,6 +236,16 @@ def check_typosquatting(package_name: str, popular_packages: List[str], threshol
     }
 
 
+# Common homoglyph mappings
+_HOMOGLYPH_MAP = {
+    'а': 'a', 'е': 'e', 'о': 'o', 'р': 'p', 'с': 'c', 'у': 'y', 'х': 'x',  # Cyrillic
+    'ο': 'o', 'ν': 'v', 'α': 'a',  # Greek
+    '０': '0', '１': '1', 'Ｏ': 'O', 'Ｉ': 'I'  # Fullwidth
+}
+_HOMOGLYPH_TABLE = str.maketrans(_HOMOGLYPH_MAP)
+_HOMOGLYPH_CHARS = frozenset(_HOMOGLYPH_MAP)
+
+
 def check_homoglyphs(package_name: str, popular_packages: List[str]) -> Dict[str, any]:
     """
     Check for homoglyph attacks (using visually similar Unicode characters).
@@ -141,27 +261,21 @@ def check_homoglyphs(package_name: str, popular_packages: List[str]) -> Dict[str
     Returns:
         Dictionary with detection results
     """
-    # Common homoglyph mappings
-    homoglyph_map = {
-        'а': 'a', 'е': 'e', 'о': 'o', 'р': 'p', 'с': 'c', 'у': 'y', 'х': 'x',  # Cyrillic
-        'ο': 'o', 'ν': 'v', 'α': 'a',  # Greek
-        '０': '0', '１': '1', 'Ｏ': 'O', 'Ｉ': 'I'  # Fullwidth
-    }
-    
-    # Normalize by replacing homoglyphs
-    normalized = package_name
-    homoglyphs_found = []
-    
-    for char in package_name:
-        if char in homoglyph_map:
-            homoglyphs_found.append(char)
-            normalized = normalized.replace(char, homoglyph_map[char])
+    # Normalize all homoglyphs in one translate pass
+    # Most names contain none, which one C-level set check settles
+    if _HOMOGLYPH_CHARS.isdisjoint(package_name):
+        homoglyphs_found = []
+        normalized = package_name
+    else:
+        homoglyphs_found = [char for char in package_name if char in _HOMOGLYPH_CHARS]
+        normalized = package_name.translate(_HOMOGLYPH_TABLE)
     
     # Check if normalized version matches a popular package
-    matches = []
-    for popular in popular_packages:
-        if normalized.lower() == popular.lower():
-            matches.append(popular)
+    normalized_lower = normalized.lower()
+    matches = [
+        popular for popular, popular_lower in zip(popular_packages, _lowered(popular_packages))
+        if normalized_lower == popular_lower
+    ]
     
     return {
         'detected': len(homoglyphs_found) > 0,
@@ -170,6 +284,25 @@ def check_homoglyphs(package_name: str, popular_packages: List[str]) -> Dict[str
     }
 
 
+# Common combosquatting patterns
+COMMON_ADDITIONS = [
+    '-', '_', 'v2', '2', 'py', 'python', 
+    'helper', 'utils', 'tool', 'tools', 'lib', 'library',
+    'secure', 'safe', 'plus', 'extended', 'pro'
+]
+_ADDITIONS_ALT = '|'.join(map(re.escape, COMMON_ADDITIONS))
+_ADDITION_AT_START = re.compile(f'(?:{_ADDITIONS_ALT})')
+_ADDITION_AT_END = re.compile(f'(?:{_ADDITIONS_ALT})$')
+
+
+def _name_index(popular_packages: List[str]) -> Dict[str, int]:
+    """Lowercased name -> position of its first occurrence in popular_packages."""
+    index = {}
+    for position, popular_lower in enumerate(_lowered(popular_packages)):
+        index.setdefault(popular_lower, position)
+    return index
+
+
 def check_combosquatting(package_name: str, popular_packages: List[str]) -> Dict[str, any]:
     """
     Check for combosquatting (legitimate name + suffix/prefix).
@@ -191,43 +324,36 @@ def check_combosquatting(package_name: str, popular_packages: List[str]) -> Dict
         }
     """
     package_lower = package_name.lower()
-    
-    # Common combosquatting patterns
-    common_additions = [
-        '-', '_', 'v2', '2', 'py', 'python', 
-        'helper', 'utils', 'tool', 'tools', 'lib', 'library',
-        'secure', 'safe', 'plus', 'extended', 'pro'
-    ]
-    
-    for popular in popular_packages:
-        popular_lower = popular.lower()
-        
-        # Check if package name contains popular name
-        if popular_lower in package_lower and package_lower != popular_lower:
-            # Check if it's a simple addition (not a legitimate related package)
-            # This is combosquatting if:
-            # 1. Popular name is at start or end
-            # 2. Addition is a common combosquatting pattern
-            
-            if package_lower.startswith(popular_lower):
-                suffix = package_lower[len(popular_lower):]
-                if any(suffix.startswith(add) or suffix == add for add in common_additions):
-                    return {
-                        'is_combosquatting': True,
-                        'base_package': popular,
-                        'pattern': 'suffix',
-                        'addition': suffix
-                    }
-            
-            if package_lower.endswith(popular_lower):
-                prefix = package_lower[:-len(popular_lower)]
-                if any(prefix.endswith(add) or prefix == add for add in common_additions):
-                    return {
-                        'is_combosquatting': True,
-                        'base_package': popular,
-                        'pattern': 'prefix',
-                        'addition': prefix
-                    }
+    index = _TOP_PACKAGES_INDEX if popular_packages is TOP_PACKAGES else _name_index(popular_packages)
+    n = len(package_lower)
+    
+    # Popular names that start or end the package name, found by slicing the
+    # name once per length instead of substring-searching every candidate.
+    # (position, 0) = name at start, check the suffix; (position, 1) = at end.
+    hits = [(index[package_lower[:k]], 0, k) for k in range(n) if package_lower[:k] in index]
+    hits += [(index[package_lower[k:]], 1, k) for k in range(1, n) if package_lower[k:] in index]
+    
+    # Same precedence as scanning popular_packages in order, suffix before prefix
+    for position, kind, k in sorted(hits):
+        popular = popular_packages[position]
+        if kind == 0:
+            suffix = package_lower[k:]
+            if _ADDITION_AT_START.match(suffix):
+                return {
+                    'is_combosquatting': True,
+                    'base_package': popular,
+                    'pattern': 'suffix',
+                    'addition': suffix
+                }
+        else:
+            prefix = package_lower[:k]
+            if _ADDITION_AT_END.search(prefix):
+                return {
+                    'is_combosquatting': True,
+                    'base_package': popular,
+                    'pattern': 'prefix',
+                    'addition': prefix
+                }
     
     return {
         'is_combosquatting': False,
@@ -236,6 +362,40 @@ def check_combosquatting(package_name: str, popular_packages: List[str]) -> Dict
     }
 
 
+_GENERIC_AUTHOR_NAMES = frozenset({
+    'admin', 'test', 'user', 'developer', 'dev', 'root',
+    'author', 'owner', 'maintainer', 'example', 'demo'
+})
+
+# Character classes of the `local@domain.tld` format accepted below
+_EMAIL_LOCAL_CHARS = string.ascii_letters + string.digits + '._%+-'
+_EMAIL_DOMAIN_CHARS = string.ascii_letters + string.digits + '.-'
+
+
+def _email_format_ok(email: str) -> bool:
+    """
+    Same check as the regex ^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\\.[a-zA-Z]{2,}$,
+    done with str methods: no regex engine work and no backtracking on
+    crafted input.
+    """
+    if email.endswith('\n'):
+        email = email[:-1]  # `$` also matches before a trailing newline
+    local, sep, domain = email.partition('@')
+    host, dot, tld = domain.rpartition('.')
+    return bool(
+        sep and dot and local and host
+        and not local.strip(_EMAIL_LOCAL_CHARS)
+        and not host.strip(_EMAIL_DOMAIN_CHARS)
+        and len(tld) >= 2 and tld.isascii() and tld.isalpha()
+    )
+
+_DISPOSABLE_EMAIL_DOMAINS = frozenset({
+    'tempmail.com', 'guerrillamail.com', '10minutemail.com',
+    'mailinator.com', 'throwaway.email', 'temp-mail.org',
+    'sharklasers.com', 'guerrillamail.info'
+})
+
+
 def validate_author_info(author: str, email: str) -> Dict[str, any]:
     """
     Validate package author information for suspicious patterns.
@@ -261,14 +421,9 @@ def validate_author_info(author: str, email: str) -> Dict[str, any]:
     issues = []
     
     # Check for generic names
-    generic_names = [
-        'admin', 'test', 'user', 'developer', 'dev', 'root',
-        'author', 'owner', 'maintainer', 'example', 'demo'
-    ]
-    
     if author:
         author_lower = author.lower().strip()
-        if author_lower in generic_names:
+        if author_lower in _GENERIC_AUTHOR_NAMES:
             issues.append(f"Generic author name: '{author}'")
         elif len(author) < 2:
             issues.append("Very short author name")
@@ -276,21 +431,13 @@ def validate_author_info(author: str, email: str) -> Dict[str, any]:
         issues.append("Missing author name")
     
     # Validate email format
-    email_regex = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    
     if email:
-        if not re.match(email_regex, email):
+        if not _email_format_ok(email):
             issues.append(f"Invalid email format: '{email}'")
         else:
             # Check for disposable email providers
-            disposable_domains = [
-                'tempmail.com', 'guerrillamail.com', '10minutemail.com',
-                'mailinator.com', 'throwaway.email', 'temp-mail.org',
-                'sharklasers.com', 'guerrillamail.info'
-            ]
-            
             email_domain = email.split('@')[-1].lower()
-            if email_domain in disposable_domains:
+            if email_domain in _DISPOSABLE_EMAIL_DOMAINS:
                 issues.append(f"Disposable email provider: {email_domain}")
     else:
         issues.append("Missing author email")
@@ -321,14 +468,15 @@ def validate_description(description: str, package_name: str) -> Dict[str, any]:
         Dictionary with validation results
     """
     issues = []
+    stripped = description.strip() if description else ''
     
-    if not description or len(description.strip()) == 0:
+    if not stripped:
         issues.append("Empty description")
         severity = 'WARNING'
-    elif len(description.strip()) < 10:
+    elif len(stripped) < 10:
         issues.append(f"Very short description ({len(description)} chars)")
         severity = 'WARNING'
-    elif description.strip().lower() == package_name.lower():
+    elif stripped.lower() == package_name.lower():
         issues.append("Description identical to package name")
         severity = 'WARNING'
     else:
@@ -359,3 +507,7 @@ TOP_PACKAGES = [
     'multidict', 'h11', 'tornado', 'anyio', 'pyOpenSSL', 'cachetools', 'smmap', 'gitdb',
     'gitpython', 'entrypoints', 'httpx', 'lxml', 'coverage', 'prometheus-client', 'google-api-python-client'
 ]
+
+# Lowercased name list and lookup index for the default candidates, built once
+_TOP_PACKAGES_LOWER = [p.lower() for p in TOP_PACKAGES]
+_TOP_PACKAGES_INDEX = _name_index(TOP_PACKAGES)
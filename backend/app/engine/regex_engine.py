@@ -1,33 +1,126 @@
+import bisect
 import re
 
-def run_regex_scan(content: str, patterns: list):
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Prefer Google RE2 when available: it matches in linear time, so attacker
+# controlled package content can't trigger catastrophic backtracking.
+try:
+    import re2 as _re_backend
+except ImportError:
+    _re_backend = re
+
+def compile_pattern(pattern: str):
+    """
+    Compiles a rule pattern with RE2 if installed, falling back to `re` for
+    patterns RE2 does not support (backreferences, lookaround).
+    """
+    if _re_backend is not re:
+        try:
+            return _re_backend.compile(pattern)
+        except Exception:
+            pass
+    return re.compile(pattern)
+
+# Backreferences are numbered/named per pattern and break once patterns are joined
+_BACKREF = re.compile(r'\\[1-9]|\(\?P=')
+
+def compile_prefilter(patterns: list):
+    """
+    Compiles all rule pattern strings into one alternation so clean content
+    (the common case) is rejected in a single pass instead of one pass per
+    rule. Returns None when there is nothing to gain or the patterns can't be
+    safely combined.
+    """
+    if len(patterns) < 2 or any(_BACKREF.search(p) for p in patterns):
+        return None
+    try:
+        return compile_pattern('|'.join(f'(?:{p})' for p in patterns))
+    except re.error:
+        return None
+
+# Above this size the newline index is kept as a numpy offset array instead of
+# a list of Python ints (~8x smaller) and lines are looked up in one
+# vectorized searchsorted per rule
+_NUMPY_LINE_INDEX_MIN = 100_000
+
+def _newline_positions(content: str):
+    if np is not None and len(content) > _NUMPY_LINE_INDEX_MIN:
+        # Match offsets count characters, so use a fixed-width encoding:
+        # one byte per char for ASCII, UTF-32 code units otherwise
+        if content.isascii():
+            buf = np.frombuffer(content.encode('ascii'), dtype=np.uint8)
+        else:
+            buf = np.frombuffer(content.encode('utf-32-le', 'surrogatepass'), dtype=np.uint32)
+        return np.flatnonzero(buf == 0x0A)
+
+    positions = []
+    i = content.find('\n')
+    while i != -1:
+        positions.append(i)
+        i = content.find('\n', i + 1)
+    return positions
+
+def _line_numbers(newline_positions, starts: list) -> list:
+    """1-based line numbers of the character offsets in `starts`."""
+    if isinstance(newline_positions, list):
+        return [bisect.bisect_left(newline_positions, start) + 1 for start in starts]
+    return (np.searchsorted(newline_positions, starts, side='left') + 1).tolist()
+
+def run_regex_scan(content: str, patterns: list, prefilter=None):
     """
     Scans the content using a list of regex patterns.
+    `prefilter` is the combined regex from compile_prefilter; content it
+    doesn't match can't match any single pattern and is skipped.
     Each pattern in the list should be a dictionary with keys:
     - pattern: compiled regex object
     - message: warning message
     - id: rule id
     - severity: 'CRITICAL', 'WARNING', 'INFO'
+    Optional keys:
+    - unique: report only the first match (e.g. a shebang or marker string)
+    - needs_snippet: False to skip extracting the matched text (snippet is None)
     """
+    if prefilter is not None and prefilter.search(content) is None:
+        return []
+
     findings = []
-    lines = content.splitlines()
+    # Offsets of every '\n', built on the first match; a match's line number
+    # is then a binary search instead of recounting the whole prefix
+    newline_positions = None
 
     for rule in patterns:
-        matches = rule['pattern'].finditer(content)
-        for match in matches:
-            # Find line number
-            start_index = match.start()
-            line_no = content[:start_index].count('\n') + 1
-            
-            # Context snippet (e.g. the matching line)
-            match_str = match.group()
+        if rule.get('unique'):
+            first = rule['pattern'].search(content)
+            matches = [first] if first else []
+        else:
+            matches = list(rule['pattern'].finditer(content))
+        if not matches:
+            continue
+        if newline_positions is None:
+            newline_positions = _newline_positions(content)
+        # Find line numbers
+        line_nos = _line_numbers(newline_positions, [match.start() for match in matches])
+
+        needs_snippet = rule.get('needs_snippet', True)
+        for match, line_no in zip(matches, line_nos):
+            # Context snippet (e.g. the matching line), truncated to 100 chars
+            # by slicing content directly instead of copying the whole match
+            if needs_snippet:
+                start, end = match.span()
+                snippet = content[start:min(end, start + 100)]
+            else:
+                snippet = None
             
             findings.append({
                 "rule_id": rule['id'],
                 "line": line_no,
                 "message": rule['message'],
                 "severity": rule.get('severity', 'WARNING'),
-                "snippet": match_str[:100] # Truncate if too long
+                "snippet": snippet
             })
             
     return findings
@@ -0,0 +1,64 @@
+"""
+AST rule registry.
+
+Each category package already exposes its `check` functions as an ordered
+`<CATEGORY>_RULES` list in its `__init__.py`. `get_rules` imports a category
+on first use and caches the result, so callers never walk the rule
+directories or import rule files one by one.
+
+SecurityVisitor only ever calls a rule's `check(node, visitor)` with an
+`ast.Call` node, so rules don't need to guard on the node type. It copies the
+fields it needs out of the returned dict, so rules may return shared,
+module-level result dicts; callers must treat them as read-only.
+"""
+import importlib
+from functools import lru_cache
+
+RULE_CATEGORIES = {
+    'execution': 'EXECUTION_RULES',
+    'network': 'NETWORK_RULES',
+    'file_ops': 'FILE_OPS_RULES',
+    'evasion': 'EVASION_RULES',
+    'exfiltration': 'EXFILTRATION_RULES',
+    'metadata': 'METADATA_RULES',
+    'installation': 'INSTALLATION_RULES',
+    'recon': 'RECON_RULES',
+    'process': 'PROCESS_RULES',
+}
+
+def call_targets(names=(), methods=()):
+    """
+    Declares the resolved call names (e.g. 'subprocess.Popen') and/or method
+    names (the last part of the call, e.g. 'setup' for `x.setup(...)`) a rule
+    can fire on. SecurityVisitor then skips the rule for every other Call.
+    Rules that match on substrings or any Call should stay undecorated.
+    """
+    def decorator(func):
+        func.targets = frozenset(names)
+        func.methods = frozenset(methods)
+        return func
+    return decorator
+
+# open() mode characters that make a file writable ('r+' included)
+WRITE_MODE_CHARS = frozenset('wa+')
+# Mode characters that only write ('w'/'a'); '+' alone (r+) still reads
+WRITE_ONLY_CHARS = frozenset('wa')
+
+def is_write_mode(node, visitor, chars=WRITE_MODE_CHARS) -> bool:
+    """True if any constant mode of the open() Call `node` contains one of `chars`."""
+    return any(not chars.isdisjoint(mode) for mode in visitor.open_modes(node))
+
+def file_ext(path: str) -> str:
+    """Lowercased extension of `path`, same result as os.path.splitext(path)[1].lower()."""
+    dot = path.rfind('.')
+    start = path.rfind('/') + 1
+    # Leading dots of the file name (".bashrc") don't start an extension
+    if dot <= start or not path[start:dot].strip('.'):
+        return ''
+    return path[dot:].lower()
+
+@lru_cache(maxsize=None)
+def get_rules(category: str) -> tuple:
+    """Returns the rule functions for `category`, importing its package once."""
+    module = importlib.import_module(f"{__name__}.{category}")
+    return tuple(getattr(module, RULE_CATEGORIES[category]))
@@ -1,5 +1,7 @@
 import ast
+from app.engine.rules import call_targets
 
+@call_targets({'exec', 'eval'})
 def check(node, visitor):
     """
     Rule ID: EVADE_ASCII_ART_HIDING
@@ -7,41 +9,26 @@ def check(node, visitor):
     Severity: CRITICAL
     """
     
-    if isinstance(node, ast.Call):
-        func_name = _get_func_name(node, visitor.aliases)
-        
-        if func_name == 'exec' or func_name == 'eval':
-            if node.args:
-                arg0 = node.args[0]
-                if isinstance(arg0, ast.Name):
-                    # exec(__doc__)
-                    if arg0.id == '__doc__':
-                        return {
-                            "id": "EVADE_ASCII_ART_HIDING",
-                            "message": "Execution of docstring detected: exec(__doc__).",
-                            "severity": "CRITICAL"
-                        }
-                elif isinstance(arg0, ast.Attribute):
-                    # func.__doc__
-                    if arg0.attr == '__doc__':
-                         return {
-                            "id": "EVADE_ASCII_ART_HIDING",
-                            "message": "Execution of docstring detected (attr.__doc__).",
-                            "severity": "CRITICAL"
-                        }
+    func_name = visitor.qualified_name(node)
+    
+    if func_name == 'exec' or func_name == 'eval':
+        if node.args:
+            arg0 = node.args[0]
+            if type(arg0) is ast.Name:
+                # exec(__doc__)
+                if arg0.id == '__doc__':
+                    return {
+                        "id": "EVADE_ASCII_ART_HIDING",
+                        "message": "Execution of docstring detected: exec(__doc__).",
+                        "severity": "CRITICAL"
+                    }
+            elif type(arg0) is ast.Attribute:
+                # func.__doc__
+                if arg0.attr == '__doc__':
+                     return {
+                        "id": "EVADE_ASCII_ART_HIDING",
+                        "message": "Execution of docstring detected (attr.__doc__).",
+                        "severity": "CRITICAL"
+                    }
                         
     return None
-
-def _get_func_name(node, alias_map):
-    if isinstance(node.func, ast.Attribute):
-        if isinstance(node.func.value, ast.Name):
-            module = node.func.value.id
-            if module in alias_map:
-                module = alias_map[module]
-            return f"{module}.{node.func.attr}"
-    elif isinstance(node.func, ast.Name):
-        func_id = node.func.id
-        if func_id in alias_map:
-            return alias_map[func_id]
-        return func_id
-    return None
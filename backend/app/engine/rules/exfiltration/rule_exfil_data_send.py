@@ -1,32 +1,21 @@
 import ast
+from app.engine.rules import call_targets
 
+SENSITIVE_KEYWORDS = ('KEY', 'SECRET', 'TOKEN', 'PASSWORD', 'AWS', 'AUTH')
+
+@call_targets(methods={'get', 'getenv'})
 def check(node, visitor):
     """
     Rule: Detect accessing environment variables (often for keys/secrets).
     Addresses: code_exfiltration_data, code_fileops_modify_system_environment
     """
-    func_name = _get_func_name(node, visitor.aliases)
+    func_name = visitor.dotted_name(node)
 
     if func_name == 'os.environ.get' or func_name == 'os.getenv':
         # Check arguments for sensitive keywords
-        if node.args and isinstance(node.args[0], ast.Constant) and isinstance(node.args[0].value, str):
+        if node.args and type(node.args[0]) is ast.Constant and type(node.args[0].value) is str:
             key = node.args[0].value.upper()
-            if any(s in key for s in ['KEY', 'SECRET', 'TOKEN', 'PASSWORD', 'AWS', 'AUTH']):
+            if any(s in key for s in SENSITIVE_KEYWORDS):
                 return {"id": "EXFIL-002", "message": f"Trying to access sensitive Environment Variable ({key}).", "severity": "CRITICAL"}
 
     return None
-
-def _get_func_name(node, alias_map):
-    parts = []
-    current = node.func
-    while isinstance(current, ast.Attribute):
-        parts.append(current.attr)
-        current = current.value
-    
-    if isinstance(current, ast.Name):
-        name = current.id
-        if name in alias_map:
-            name = alias_map[name]
-        parts.append(name)
-    
-    return ".".join(reversed(parts))
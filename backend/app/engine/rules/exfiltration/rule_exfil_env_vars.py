@@ -1,78 +1,82 @@
 import ast
+from app.engine.rules import call_targets
 
+NET_TARGETS = frozenset({
+    'requests.get', 'requests.post', 'requests.put', 
+    'urllib.request.urlopen', 'http.client.HTTPConnection.request'
+})
+
+@call_targets(NET_TARGETS)
 def check(node, visitor):
     """
     Rule ID: EXFIL_ENV_CREDENTIALS
     Description: Detects sending environment variables (potentially credentials) over network.
     Severity: CRITICAL
     """
-    net_targets = {
-        'requests.get', 'requests.post', 'requests.put', 
-        'urllib.request.urlopen', 'http.client.HTTPConnection.request'
-    }
+    func_name = visitor.qualified_name(node)
     
-    if isinstance(node, ast.Call):
-        func_name = _get_func_name(node, visitor.aliases)
+    if func_name in NET_TARGETS:
+        # Check if arguments involve os.environ
         
-        if func_name in net_targets:
-            # Check if arguments involve os.environ
-            
-            # Helper to recursively check for os.environ
-            if _has_environ_access(node):
-                 return {
-                    "id": "EXFIL_ENV_CREDENTIALS",
-                    "message": f"Environment variable exfiltration detected via {func_name}. Sending env vars over network.",
-                    "severity": "CRITICAL"
-                }
+        # Helper to recursively check for os.environ
+        if _has_environ_access(node, visitor.rule_cache(__name__)):
+             return {
+                "id": "EXFIL_ENV_CREDENTIALS",
+                "message": f"Environment variable exfiltration detected via {func_name}. Sending env vars over network.",
+                "severity": "CRITICAL"
+            }
 
     return None
 
-def _has_environ_access(node):
-    """Recursively check for os.environ or os.getenv usage in AST node."""
-    if isinstance(node, ast.Name) and node.id == 'environ': # ambiguous but suspicious
-        return True
-    if isinstance(node, ast.Attribute):
-        if isinstance(node.value, ast.Name) and node.value.id == 'os' and node.attr == 'environ':
-            return True
-        if node.attr == 'environ':
-             return True
-             
-    if isinstance(node, ast.Call):
-        # check os.getenv
-        if isinstance(node.func, ast.Attribute):
-             if isinstance(node.func.value, ast.Name) and node.func.value.id == 'os' and node.func.attr == 'getenv':
-                 return True
-        
-        # Recurse into args
-        for arg in node.args:
-            if _has_environ_access(arg):
+def _has_environ_access(root, cache):
+    """
+    Check for os.environ or os.getenv usage in call arguments and containers.
+    Results for Call nodes are memoized in `cache` (keyed by id, valid for one
+    file's scan), so a call nested in another network call is walked once.
+    """
+    nid = id(root)
+    result = cache.get(nid)
+    if result is None:
+        result = cache[nid] = _walk_environ_access(root, cache)
+    return result
+
+def _walk_environ_access(root, cache):
+    # Iterative walk with an explicit stack, returning at the first hit
+    stack = [root]
+    push = stack.append
+    pop = stack.pop
+    while stack:
+        node = pop()
+        t = type(node)
+        if t is ast.Name:
+            if node.id == 'environ': # ambiguous but suspicious
                 return True
-        for k in node.keywords:
-            if _has_environ_access(k.value):
+        elif t is ast.Attribute:
+            # Covers os.environ as well as any other `.environ`
+            if node.attr == 'environ':
                 return True
-                
-    if isinstance(node, (ast.List, ast.Tuple, ast.Set)):
-        for elt in node.elts:
-            if _has_environ_access(elt):
+        elif t is ast.Call:
+            # check os.getenv
+            func = node.func
+            if type(func) is ast.Attribute and func.attr == 'getenv' and type(func.value) is ast.Name and func.value.id == 'os':
                 return True
-                
-    if isinstance(node, ast.Dict):
-        for k, v in zip(node.keys, node.values):
-            if k and _has_environ_access(k): return True
-            if _has_environ_access(v): return True
-            
+            # Nested calls get their own memoized walk
+            if node is not root:
+                if _has_environ_access(node, cache):
+                    return True
+                continue
+            # Walk into args
+            for arg in node.args:
+                push(arg)
+            for k in node.keywords:
+                push(k.value)
+        elif t is ast.List or t is ast.Tuple or t is ast.Set:
+            for elt in node.elts:
+                push(elt)
+        elif t is ast.Dict:
+            for k in node.keys:
+                if k is not None:
+                    push(k)
+            for v in node.values:
+                push(v)
     return False
-
-def _get_func_name(node, alias_map):
-    if isinstance(node.func, ast.Attribute):
-        if isinstance(node.func.value, ast.Name):
-            module = node.func.value.id
-            if module in alias_map:
-                module = alias_map[module]
-            return f"{module}.{node.func.attr}"
-    elif isinstance(node.func, ast.Name):
-        func_id = node.func.id
-        if func_id in alias_map:
-            return alias_map[func_id]
-        return func_id
-    return None
@@ -1,32 +1,26 @@
 import ast
+from app.engine.rules import call_targets
 
+SENSITIVE_PATHS = frozenset({
+    '/etc/shadow', '/etc/passwd', '/etc/hosts', 
+    '~/.ssh/id_rsa', '~/.aws/credentials', '.bashrc', '.zshrc',
+    '/etc/cron.d', '/etc/init.d'
+})
+
+@call_targets({'open'})
 def check(node, visitor):
     """
     Rule: Detect reading/writing of sensitive files.
     Addresses: code_fileops_read_sensitive_files, code_fileops_write_to_sensitive_location
     """
-    targets = {
-        '/etc/shadow', '/etc/passwd', '/etc/hosts', 
-        '~/.ssh/id_rsa', '~/.aws/credentials', '.bashrc', '.zshrc',
-        '/etc/cron.d', '/etc/init.d'
-    }
-    
     # Check open calls
-    func_name = _get_func_name(node, visitor.aliases)
+    func_name = visitor.qualified_name(node)
     
     if func_name == 'open':
         # Check arguments
-        if node.args and isinstance(node.args[0], ast.Constant) and isinstance(node.args[0].value, str):
+        if node.args and type(node.args[0]) is ast.Constant and type(node.args[0].value) is str:
             path = node.args[0].value
-            if any(t in path for t in targets):
+            if any(t in path for t in SENSITIVE_PATHS):
                 return {"id": "FILE-001", "message": f"Sensitive File Access detected: {path}", "severity": "CRITICAL"}
     
     return None
-
-def _get_func_name(node, alias_map):
-    if isinstance(node.func, ast.Name):
-        func_id = node.func.id
-        if func_id in alias_map:
-            return alias_map[func_id]
-        return func_id
-    return None
@@ -1,5 +1,12 @@
-import ast
+from app.engine.rules import call_targets
 
+DANGEROUS_FUNCS = frozenset({
+    'os.system', 'os.popen', 'os.spawn', 'os.spawnl', 'os.spawnv',
+    'subprocess.Popen', 'subprocess.run', 'subprocess.call', 'subprocess.check_output',
+    'exec', 'eval'
+})
+
+@call_targets(DANGEROUS_FUNCS)
 def check(node, visitor):
     """
     Rule ID: INSTALL_SETUP_EXEC
@@ -16,16 +23,10 @@ def check(node, visitor):
     Research: GuardDog command_overwrites heuristic
     """
     # Target dangerous execution functions
-    dangerous_funcs = {
-        'os.system', 'os.popen', 'os.spawn', 'os.spawnl', 'os.spawnv',
-        'subprocess.Popen', 'subprocess.run', 'subprocess.call', 'subprocess.check_output',
-        'exec', 'eval'
-    }
-    
     # Get function name with alias resolution
-    func_name = _get_func_name(node, visitor.aliases)
+    func_name = visitor.qualified_name(node)
     
-    if func_name and func_name in dangerous_funcs:
+    if func_name and func_name in DANGEROUS_FUNCS:
         # This is a setup.py-specific check
         # In a real implementation, we'd pass filename context
         # For now, flag ALL module-level dangerous calls with WARNING
@@ -39,18 +40,3 @@ def check(node, visitor):
         }
     
     return None
-
-def _get_func_name(node, alias_map):
-    """Helper to resolve function name with alias support."""
-    if isinstance(node.func, ast.Attribute):
-        if isinstance(node.func.value, ast.Name):
-            module = node.func.value.id
-            if module in alias_map:
-                module = alias_map[module]
-            return f"{module}.{node.func.attr}"
-    elif isinstance(node.func, ast.Name):
-        func_id = node.func.id
-        if func_id in alias_map:
-            return alias_map[func_id]
-        return func_id
-    return None
@@ -1,5 +1,20 @@
 import ast
+from app.engine.rules import call_targets
 
+PACKAGE_MANAGERS = frozenset({
+    'subprocess.Popen', 'subprocess.run', 'subprocess.call', 'subprocess.check_output',
+    'os.system', 'os.popen'
+})
+
+# Checked in order; the first match is the one reported
+SUSPICIOUS_COMMANDS = (
+    'pip install', 'pip3 install', 'python -m pip install',
+    'npm install', 'yarn add',
+    'apt install', 'apt-get install',
+    'yum install', 'dnf install'
+)
+
+@call_targets(PACKAGE_MANAGERS)
 def check(node, visitor):
     """
     Rule ID: INSTALL_DYNAMIC_PACKAGE
@@ -14,30 +29,18 @@ def check(node, visitor):
     
     Research: Common supply chain attack pattern
     """
-    func_name = _get_func_name(node, visitor.aliases)
+    func_name = visitor.qualified_name(node)
     
     # Check for package manager invocations
-    package_managers = {
-        'subprocess.Popen', 'subprocess.run', 'subprocess.call', 'subprocess.check_output',
-        'os.system', 'os.popen'
-    }
-    
-    if func_name not in package_managers:
+    if func_name not in PACKAGE_MANAGERS:
         return None
     
     # Check arguments for package installation commands
     command_str = _extract_command_string(node)
     
     if command_str:
-        suspicious_commands = [
-            'pip install', 'pip3 install', 'python -m pip install',
-            'npm install', 'yarn add',
-            'apt install', 'apt-get install',
-            'yum install', 'dnf install'
-        ]
-        
         command_lower = command_str.lower()
-        for cmd in suspicious_commands:
+        for cmd in SUSPICIOUS_COMMANDS:
             if cmd in command_lower:
                 return {
                     "id": "INSTALL_DYNAMIC_PACKAGE",
@@ -48,21 +51,6 @@ def check(node, visitor):
     
     return None
 
-def _get_func_name(node, alias_map):
-    """Helper to resolve function name."""
-    if isinstance(node.func, ast.Attribute):
-        if isinstance(node.func.value, ast.Name):
-            module = node.func.value.id
-            if module in alias_map:
-                module = alias_map[module]
-            return f"{module}.{node.func.attr}"
-    elif isinstance(node.func, ast.Name):
-        func_id = node.func.id
-        if func_id in alias_map:
-            return alias_map[func_id]
-        return func_id
-    return None
-
 def _extract_command_string(node):
     """Extract command string from subprocess/os.system call."""
     # Check first positional argument (command)
@@ -70,14 +58,14 @@ def _extract_command_string(node):
         arg = node.args[0]
         
         # String literal
-        if isinstance(arg, ast.Constant) and isinstance(arg.value, str):
+        if type(arg) is ast.Constant and type(arg.value) is str:
             return arg.value
         
         # List of strings (subprocess with list)
-        if isinstance(arg, ast.List):
+        if type(arg) is ast.List:
             parts = []
             for elt in arg.elts:
-                if isinstance(elt, ast.Constant) and isinstance(elt.value, str):
+                if type(elt) is ast.Constant and type(elt.value) is str:
                     parts.append(elt.value)
             return ' '.join(parts)
     
@@ -1,46 +1,33 @@
 import ast
-import os
+from app.engine.rules import call_targets, file_ext
 
+TARGETS = frozenset({'urllib.request.urlretrieve', 'requests.get'})
+ARCHIVE_EXTS = frozenset({'.zip', '.tar', '.gz', '.7z', '.rar'})
+
+@call_targets(TARGETS)
 def check(node, visitor):
     """
     Rule ID: NETWORK_DOWNLOAD_ARCHIVE
     Description: Detects downloading of archive files (zip, tar, etc.).
     Severity: WARNING
     """
-    targets = {'urllib.request.urlretrieve', 'requests.get'}
+    func_name = visitor.qualified_name(node)
     
-    if isinstance(node, ast.Call):
-        func_name = _get_func_name(node, visitor.aliases)
+    if func_name in TARGETS:
+        url_arg = None
+        if node.args:
+            arg0 = node.args[0]
+            if type(arg0) is ast.Constant and type(arg0.value) is str:
+                url_arg = arg0.value
         
-        if func_name in targets:
-            url_arg = None
-            if node.args:
-                arg0 = node.args[0]
-                if isinstance(arg0, ast.Constant) and isinstance(arg0.value, str):
-                    url_arg = arg0.value
-            
-            if url_arg:
-                path = url_arg.split('?')[0]
-                ext = os.path.splitext(path)[1].lower()
-                if ext in {'.zip', '.tar', '.gz', '.7z', '.rar'}:
-                    return {
-                        "id": "NETWORK_DOWNLOAD_ARCHIVE",
-                        "message": f"Downloading archive file detected: {url_arg}",
-                        "severity": "WARNING"
-                    }
-
-    return None
+        if url_arg:
+            query = url_arg.find('?')
+            ext = file_ext(url_arg if query < 0 else url_arg[:query])
+            if ext in ARCHIVE_EXTS:
+                return {
+                    "id": "NETWORK_DOWNLOAD_ARCHIVE",
+                    "message": f"Downloading archive file detected: {url_arg}",
+                    "severity": "WARNING"
+                }
 
-def _get_func_name(node, alias_map):
-    if isinstance(node.func, ast.Attribute):
-        if isinstance(node.func.value, ast.Name):
-            module = node.func.value.id
-            if module in alias_map:
-                module = alias_map[module]
-            return f"{module}.{node.func.attr}"
-    elif isinstance(node.func, ast.Name):
-        func_id = node.func.id
-        if func_id in alias_map:
-            return alias_map[func_id]
-        return func_id
     return None
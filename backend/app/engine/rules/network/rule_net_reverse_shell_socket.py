@@ -1,5 +1,7 @@
 import ast
+from app.engine.rules import call_targets
 
+@call_targets({'socket.socket', 'pty.spawn'})
 def check(node, visitor):
     """
     Rule: Detect Reverse Shell patterns.
@@ -12,7 +14,7 @@ def check(node, visitor):
     # subprocess.call(["/bin/sh", "-i"])
     
     # Check for socket.connect
-    func_name = _get_func_name(node, visitor.aliases)
+    func_name = visitor.qualified_name(node)
     
     if func_name == 'socket.socket':
         # Just creating a socket is suspicious in a library package unless it's a known network lib
@@ -20,23 +22,9 @@ def check(node, visitor):
 
     if func_name == 'pty.spawn':
         # pty.spawn("/bin/bash") is a common shell stabiliser
-        if node.args and isinstance(node.args[0], ast.Constant) and isinstance(node.args[0].value, str):
+        if node.args and type(node.args[0]) is ast.Constant and type(node.args[0].value) is str:
             arg = node.args[0].value
             if "/bin/sh" in arg or "/bin/bash" in arg:
                 return {"id": "NET-002", "message": "PTY Spawn /bin/bash detected. High probability of Reverse Shell.", "severity": "CRITICAL"}
 
     return None
-
-def _get_func_name(node, alias_map):
-    if isinstance(node.func, ast.Attribute):
-        if isinstance(node.func.value, ast.Name):
-            module = node.func.value.id
-            if module in alias_map:
-                module = alias_map[module]
-            return f"{module}.{node.func.attr}"
-    elif isinstance(node.func, ast.Name):
-        func_id = node.func.id
-        if func_id in alias_map:
-            return alias_map[func_id]
-        return func_id
-    return None
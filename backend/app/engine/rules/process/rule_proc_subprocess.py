@@ -1,29 +1,32 @@
 import ast
+from app.engine.rules import call_targets
 
-def check(node, visitor=None):
+SUBPROCESS_METHODS = frozenset({'Popen', 'call', 'run', 'check_output'})
+
+@call_targets(methods=SUBPROCESS_METHODS)
+def check(node, visitor):
     """
     Rule 01: Detect subprocess usage with shell=True
     """
-    # 1. Check if it is a Call node
-    if not isinstance(node, ast.Call):
-        return None
-
-    # 2. Check function name (subprocess.Popen, call, run)
+    # 1. Check function name (subprocess.Popen, call, run)
     is_subprocess = False
-    if isinstance(node.func, ast.Attribute):
+    if type(node.func) is ast.Attribute:
         # We look for module 'subprocess' (id) and method (attr)
         # Note: In robust AST, you'd check imports. Here we check the attribute chain.
-        if isinstance(node.func.value, ast.Name) and node.func.value.id == 'subprocess':
-            if node.func.attr in ['Popen', 'call', 'run', 'check_output']:
+        if type(node.func.value) is ast.Name and node.func.value.id == 'subprocess':
+            if node.func.attr in SUBPROCESS_METHODS:
                 is_subprocess = True
     
     if not is_subprocess:
         return None
 
-    # 3. Check arguments for shell=True
-    for keyword in node.keywords:
-        if keyword.arg == 'shell':
-            if isinstance(keyword.value, ast.Constant) and keyword.value.value is True:
-                return "CRITICAL: subprocess called with shell=True. Risk of Command Injection."
+    # 2. Check arguments for shell=True
+    shell = visitor.keyword_value(node, 'shell')
+    if type(shell) is ast.Constant and shell.value is True:
+        return {
+            "id": "PROC_SUBPROCESS_SHELL",
+            "message": "CRITICAL: subprocess called with shell=True. Risk of Command Injection.",
+            "severity": "CRITICAL"
+        }
 
     return None
\ No newline at end of file
@@ -1,14 +1,57 @@
-import subprocess, json, tempfile, os
+import asyncio, hashlib, os, tempfile
+from collections import OrderedDict
 
-def run_semgrep(content: str, config_path: str):
-    with tempfile.NamedTemporaryFile(mode='w+', suffix='.py', delete=False) as tmp:
-        tmp.write(content)
-        tmp_path = tmp.name
+try:
+    # Parses semgrep's report straight from the stdout bytes
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+# Messages of recent scans keyed by content + config (path and mtime), so
+# re-submitted files skip the semgrep process entirely. Editing a rules file
+# changes its mtime and with it every key. Only touched from the event loop.
+_RESULTS_CACHE_SIZE = 1024
+_RESULTS_CACHE: "OrderedDict[bytes, tuple]" = OrderedDict()
+
+def _results_key(content: str, config_path: str):
+    """Cache key for a scan, or None when the config isn't a local file (e.g. a registry ruleset)."""
     try:
-        # Runs Semgrep against the temp file
-        cmd = ["semgrep", "--config", config_path, "--json", tmp_path]
-        res = subprocess.run(cmd, capture_output=True, text=True)
-        data = json.loads(res.stdout)
-        return [r['extra']['message'] for r in data.get('results', [])]
-    finally:
-        if os.path.exists(tmp_path): os.remove(tmp_path)
\ No newline at end of file
+        mtime = os.stat(config_path).st_mtime_ns
+    except OSError:
+        return None
+    h = hashlib.blake2b(content.encode('utf-8', 'surrogatepass'), digest_size=16)
+    h.update(b'\x00' + config_path.encode('utf-8', 'surrogatepass'))
+    h.update(b'\x00' + str(mtime).encode())
+    return h.digest()
+
+async def run_semgrep(content: str, config_path: str):
+    key = _results_key(content, config_path)
+    cached = _RESULTS_CACHE.get(key)
+    if cached is not None:
+        _RESULTS_CACHE.move_to_end(key)
+        return list(cached)
+
+    # semgrep needs a real .py path; the file stays open while it runs
+    # (readable by the child on POSIX) and is unlinked when the block exits
+    with tempfile.NamedTemporaryFile(mode='w', suffix='.py') as tmp:
+        tmp.write(content)
+        tmp.flush()
+        # Runs Semgrep against the temp file without blocking the event loop.
+        # Local rules only, so skip the per-run network round trips for
+        # the version check and metrics upload
+        proc = await asyncio.create_subprocess_exec(
+            "semgrep", "--config", config_path, "--json",
+            "--metrics", "off", "--disable-version-check", tmp.name,
+            stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+        )
+        stdout, _ = await proc.communicate()
+    data = json_loads(stdout)
+    messages = [r['extra']['message'] for r in data.get('results', [])]
+
+    # Only completed runs are cached; a crashed or killed semgrep (any other
+    # exit status, or no report) must not be replayed as "no findings"
+    if key is not None and proc.returncode in (0, 1) and 'results' in data:
+        _RESULTS_CACHE[key] = tuple(messages)
+        if len(_RESULTS_CACHE) > _RESULTS_CACHE_SIZE:
+            _RESULTS_CACHE.popitem(last=False)
+    return messages
